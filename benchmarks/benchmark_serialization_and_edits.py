@@ -5,12 +5,20 @@ Benchmark serialization and coordinate editing performance.
 Tests:
 1. Serialization: Call orjson.dumps(font.to_dict()) 5 times
 2. Coordinate edits: Modify all x,y coordinates (+1, then -1) 5 times
+
+Each benchmark runs a fixed number of rounds. The garbage collector stays
+enabled, since allocation and collection are part of what is measured, but
+each benchmark starts from a freshly collected heap so it doesn't pay for
+garbage left by the previous one.
 """
 
+import gc
 import time
 import orjson
 from context import load
 
+ROUNDS = 5
+
 # Load Sukoon font
 print("Loading Sukoon font...")
 font = load("/Users/yanone/Desktop/Sukoon.babelfont")
@@ -32,7 +40,8 @@ print("=" * 60)
 
 # Benchmark 1: Serialization
 serialization_times = []
-for i in range(5):
+gc.collect()
+for i in range(ROUNDS):
     start = time.perf_counter()
     result = orjson.dumps(font.to_dict())
     end = time.perf_counter()
@@ -42,7 +51,7 @@ for i in range(5):
 
 avg_serialization = sum(serialization_times) / len(serialization_times)
 print(f"\nAverage serialization time: {avg_serialization:.4f} seconds")
-print(f"Total time for 5 runs: {sum(serialization_times):.4f} seconds")
+print(f"Total time for {ROUNDS} runs: {sum(serialization_times):.4f} seconds")
 
 print("\n" + "=" * 60)
 print("BENCHMARK 2: Coordinate Editing Performance")
@@ -50,7 +59,8 @@ print("=" * 60)
 
 # Benchmark 2: Coordinate editing
 edit_times = []
-for i in range(5):
+gc.collect()
+for i in range(ROUNDS):
     start = time.perf_counter()
 
     # +1 pass
@@ -78,7 +88,7 @@ for i in range(5):
 
 avg_edit = sum(edit_times) / len(edit_times)
 print(f"\nAverage coordinate editing time: {avg_edit:.4f} seconds")
-print(f"Total time for 5 runs: {sum(edit_times):.4f} seconds")
+print(f"Total time for {ROUNDS} runs: {sum(edit_times):.4f} seconds")
 
 print("\n" + "=" * 60)
 print("SUMMARY")
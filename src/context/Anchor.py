@@ -4,6 +4,9 @@ from .BaseObject import BaseObject
 class Anchor(BaseObject):
     """An anchor point in a glyph."""
 
+    # No per-instance __dict__: all state lives in BaseObject's slots
+    __slots__ = ()
+
     # Define validation rules for each field
     _field_types = {
         "name": {
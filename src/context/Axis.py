@@ -15,6 +15,9 @@ Tag = str
 class Axis(BaseObject):
     """Represents an axis in a multiple master or variable font."""
 
+    # No per-instance __dict__: all state lives in BaseObject's slots
+    __slots__ = ()
+
     _write_one_line = True
 
     def __init__(
@@ -1,7 +1,10 @@
 from typing import Union, Optional
 import orjson
 from collections import namedtuple
+import contextlib
 import datetime
+import io
+import math
 import weakref
 
 
@@ -13,138 +16,254 @@ Color = namedtuple("Color", "r,g,b,a", defaults=[0, 0, 0, 0])
 Position = namedtuple("Position", "x,y,angle", defaults=[0, 0, 0])
 Number = Union[int, float]
 
-# Standard dirty flag context names
-DIRTY_FILE_SAVING = "file_saving"
-DIRTY_CANVAS_RENDER = "canvas_render"
-DIRTY_UNDO = "undo"
-DIRTY_COMPILE = "compile"
+# Standard dirty flag contexts. Each is one bit of an object's dirty mask,
+# so several contexts can be combined with | and checked with &
+DIRTY_FILE_SAVING = 1 << 0
+DIRTY_CANVAS_RENDER = 1 << 1
+DIRTY_UNDO = 1 << 2
+DIRTY_COMPILE = 1 << 3
+
+_DIRTY_CONTEXTS = (DIRTY_FILE_SAVING, DIRTY_CANVAS_RENDER, DIRTY_UNDO, DIRTY_COMPILE)
+# The DIRTY_* constants used to be these strings. mark_dirty(), mark_clean(),
+# is_dirty() and get_dirty_fields() still accept them
+_LEGACY_DIRTY_NAMES = {
+    "file_saving": DIRTY_FILE_SAVING,
+    "canvas_render": DIRTY_CANVAS_RENDER,
+    "undo": DIRTY_UNDO,
+    "compile": DIRTY_COMPILE,
+}
+# Contexts marked by mark_dirty() when no context is given
+_DIRTY_DEFAULT = DIRTY_FILE_SAVING | DIRTY_CANVAS_RENDER
+_DIRTY_ALL = DIRTY_FILE_SAVING | DIRTY_CANVAS_RENDER | DIRTY_UNDO | DIRTY_COMPILE
+# The individual contexts contained in each combination of DIRTY_* flags,
+# computed once so per-field bookkeeping doesn't test every bit on each call
+_CONTEXTS_IN_MASK = tuple(
+    tuple(ctx for ctx in _DIRTY_CONTEXTS if mask & ctx)
+    for mask in range(_DIRTY_ALL + 1)
+)
+
+
+def _legacy_dirty_context(context):
+    """Translate a legacy string context name to its DIRTY_* flag."""
+    try:
+        return _LEGACY_DIRTY_NAMES[context]
+    except KeyError:
+        raise ValueError(f"Unknown dirty tracking context: {context!r}") from None
+
 
 # Global flag to skip user_data tracking during serialization
 _SKIP_USER_DATA_TRACKING = False
 
+# Sentinel for lookups where None is a valid value
+_MISSING = object()
+
+# Attribute lookup that skips tracked_getattribute, bound once for hot paths
+_object_getattribute = object.__getattribute__
+
+# dict's own methods, bound once so TrackedDict's overrides call them without
+# a global-plus-attribute lookup or a super() proxy on every mutation
+_dict_get = dict.get
+_dict_setitem = dict.__setitem__
+_dict_delitem = dict.__delitem__
+_dict_pop = dict.pop
+_dict_popitem = dict.popitem
+_dict_clear = dict.clear
+_dict_update = dict.update
+
+# Immutable value types for which storing an equal value is not a change
+_SCALAR_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
+
+# Key sets of dicts written as compact [x, y, angle] / [r, g, b, a] lists
+_POSITION_KEYS = frozenset(("x", "y", "angle"))
+_COLOR_KEYS = frozenset(("r", "g", "b", "a"))
+
 
 class TrackedDict(dict):
     """
     A dict subclass that notifies its owner when modified.
-    Recursively converts nested dicts to TrackedDict to track deep changes.
+    Nested dicts (also inside lists) are converted to TrackedDict when they
+    are stored, so deep changes are tracked and references handed out by
+    reads stay attached to this dict.
+
+    Use batch() to group many mutations into a single owner notification.
     """
 
+    # Every tracked object that reads its user_data holds one of these,
+    # usually empty, so don't give each a per-instance __dict__ as well
+    __slots__ = ("_owner_ref", "_batch_depth", "_batch_pending")
+
     def __init__(self, *args, owner=None, **kwargs):
         super().__init__(*args, **kwargs)
         # Store owner as weak reference to avoid circular references
         self._owner_ref = weakref.ref(owner) if owner else None
-        # Convert any nested dicts to TrackedDict
-        self._convert_nested_dicts()
-
-    def _convert_nested_dicts(self):
-        """Convert any nested plain dicts to TrackedDict."""
-        for key, value in list(self.items()):
-            if isinstance(value, dict) and not isinstance(
-                value, (TrackedDict, I18NDictionary)
-            ):
-                # Create a nested TrackedDict with same owner
-                nested = TrackedDict(
-                    owner=self._owner_ref() if self._owner_ref else None
+        self._batch_depth = 0
+        self._batch_pending = False
+        # Convert any nested dicts to TrackedDict. Replacing values doesn't
+        # resize the dict, so iterating it directly is safe
+        for key, value in self.items():
+            if type(value) not in _SCALAR_TYPES:
+                tracked = self._track_value(value)
+                if tracked is not value:
+                    _dict_setitem(self, key, tracked)
+
+    def __reduce__(self):
+        # Rebuild from a plain dict in one C-level __init__ instead of
+        # replaying every key through __setitem__. Copies and unpickled
+        # dicts are unowned: the weak owner reference can't be pickled, and
+        # filling a copy mustn't mark the original's owner dirty
+        return (self.__class__, (dict(self),))
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Group mutations so the owner is marked dirty once, on exit.
+
+        Reentrant: only the outermost batch notifies. Nested dicts are
+        separate TrackedDicts and notify on their own.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_pending:
+                self._batch_pending = False
+                self._mark_owner_dirty()
+
+    def _track_value(self, value):
+        """Return value with a plain dict (or those in a list) as TrackedDict."""
+        if isinstance(value, dict):
+            if isinstance(value, (TrackedDict, I18NDictionary)):
+                return value
+            return TrackedDict(
+                value, owner=self._owner_ref() if self._owner_ref else None
+            )
+        if isinstance(value, list) and any(
+            isinstance(item, dict)
+            and not isinstance(item, (TrackedDict, I18NDictionary))
+            for item in value
+        ):
+            # Only replace the list if there is something to convert
+            owner = self._owner_ref() if self._owner_ref else None
+            return [
+                (
+                    TrackedDict(item, owner=owner)
+                    if isinstance(item, dict)
+                    and not isinstance(item, (TrackedDict, I18NDictionary))
+                    else item
                 )
-                nested.update(value)
-                # Use dict.__setitem__ to avoid triggering dirty marking during init
-                dict.__setitem__(self, key, nested)
-            elif isinstance(value, list):
-                # Convert lists containing dicts (but not I18NDictionary)
-                new_list = []
-                for item in value:
-                    if isinstance(item, dict) and not isinstance(
-                        item, (TrackedDict, I18NDictionary)
-                    ):
-                        nested = TrackedDict(
-                            owner=self._owner_ref() if self._owner_ref else None
-                        )
-                        nested.update(item)
-                        new_list.append(nested)
-                    else:
-                        new_list.append(item)
-                if any(
-                    isinstance(item, TrackedDict) for item in new_list
-                ):  # Only replace if we converted something
-                    dict.__setitem__(self, key, new_list)
+                for item in value
+            ]
+        return value
+
+    # Read-only methods (__getitem__, get, keys, values, items, __iter__,
+    # __len__, __contains__, copy) are inherited from dict unchanged: nested
+    # dicts are converted on store, so reads need no wrapping
 
     def _mark_owner_dirty(self):
         """Mark the owner object as dirty when dict is modified."""
-        if self._owner_ref:
-            owner = self._owner_ref()
-            # Only mark dirty if owner exists and tracking is enabled
-            if (
-                owner
-                and hasattr(owner, "mark_dirty")
-                and hasattr(owner, "_tracking_enabled")
-                and owner._tracking_enabled
-            ):
-                owner.mark_dirty(
-                    DIRTY_FILE_SAVING, field_name="user_data", propagate=True
-                )
-                owner.mark_dirty(
-                    DIRTY_CANVAS_RENDER, field_name="user_data", propagate=True
-                )
+        if self._batch_depth:
+            # Inside batch(): notify once when the outermost batch exits
+            self._batch_pending = True
+            return
+        # The owner stays a weak reference (it holds this dict, and parent
+        # links are weak throughout), but read the slot only once
+        owner_ref = self._owner_ref
+        if owner_ref is None:
+            return
+        owner = owner_ref()
+        # Only mark dirty if owner exists and tracking is enabled. Use
+        # object.__getattribute__ to bypass tracked_getattribute, which
+        # would otherwise run in Python for both lookups on every mutation
+        if owner is not None and _object_getattribute(owner, "_tracking_enabled"):
+            # context=None marks DIRTY_FILE_SAVING and DIRTY_CANVAS_RENDER
+            # in a single call
+            _object_getattribute(owner, "mark_dirty")(
+                field_name="user_data", propagate=True
+            )
 
     def __setitem__(self, key, value):
-        # Convert nested dicts to TrackedDict (but not I18NDictionary)
-        if isinstance(value, dict) and not isinstance(
-            value, (TrackedDict, I18NDictionary)
-        ):
-            nested = TrackedDict(owner=self._owner_ref() if self._owner_ref else None)
-            nested.update(value)
-            value = nested
-        elif isinstance(value, list):
-            # Convert lists containing dicts (but not I18NDictionary)
-            new_list = []
-            converted = False
-            for item in value:
-                if isinstance(item, dict) and not isinstance(
-                    item, (TrackedDict, I18NDictionary)
-                ):
-                    nested = TrackedDict(
-                        owner=self._owner_ref() if self._owner_ref else None
-                    )
-                    nested.update(item)
-                    new_list.append(nested)
-                    converted = True
-                else:
-                    new_list.append(item)
-            if converted:
-                value = new_list
-
-        super().__setitem__(key, value)
-        self._mark_owner_dirty()
+        value_type = type(value)
+        if value_type in _SCALAR_TYPES:
+            # Re-storing an equal scalar of the same type is a no-op. Mutable
+            # values always notify: re-assigning the same object is how
+            # callers signal an in-place change
+            current = _dict_get(self, key, _MISSING)
+            if (
+                type(current) is value_type
+                and current == value
+                # -0.0 == 0.0, but the sign is still written out
+                and (
+                    value_type is not float
+                    or math.copysign(1.0, current) == math.copysign(1.0, value)
+                )
+            ):
+                return
+        else:
+            value = self._track_value(value)
+        _dict_setitem(self, key, value)
+        # Item assignment is the hottest mutation, so _mark_owner_dirty() is
+        # inlined here to save a call frame; keep the two in sync
+        if self._batch_depth:
+            self._batch_pending = True
+            return
+        owner_ref = self._owner_ref
+        if owner_ref is None:
+            return
+        owner = owner_ref()
+        if owner is not None and _object_getattribute(owner, "_tracking_enabled"):
+            _object_getattribute(owner, "mark_dirty")(
+                field_name="user_data", propagate=True
+            )
 
     def __delitem__(self, key):
-        super().__delitem__(key)
+        _dict_delitem(self, key)
         self._mark_owner_dirty()
 
     def clear(self):
-        super().clear()
+        _dict_clear(self)
         self._mark_owner_dirty()
 
-    def pop(self, *args, **kwargs):
-        result = super().pop(*args, **kwargs)
+    def pop(self, key, *default):
+        result = _dict_pop(self, key, _MISSING)
+        if result is _MISSING:
+            # Nothing was removed, so there is nothing to notify
+            if default:
+                return default[0]
+            raise KeyError(key)
         self._mark_owner_dirty()
         return result
 
     def popitem(self):
-        result = super().popitem()
+        result = _dict_popitem(self)
         self._mark_owner_dirty()
         return result
 
     def setdefault(self, key, default=None):
-        if key not in self:
+        value = _dict_get(self, key, _MISSING)
+        if value is _MISSING:
+            # Only a newly inserted key is a change
+            value = self._track_value(default)
+            _dict_setitem(self, key, value)
             self._mark_owner_dirty()
-        return super().setdefault(key, default)
+        return value
 
     def update(self, *args, **kwargs):
-        # First do the update with converted values
-        temp_dict = dict(*args, **kwargs)
-        for key, value in temp_dict.items():
-            self[key] = value  # This will use our __setitem__ which converts nested
-        # Note: _mark_owner_dirty is called by __setitem__ for each item
+        # Convert nested values, then one C-level merge and a single owner
+        # notification, rather than dispatching to __setitem__ for every key
+        other = dict(*args, **kwargs)
+        if not other:
+            # Nothing merged, so nothing changed
+            return
+        for key, value in other.items():
+            if type(value) not in _SCALAR_TYPES:
+                other[key] = self._track_value(value)
+        _dict_update(self, other)
+        self._mark_owner_dirty()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
 
 
 class TrackedList(list):
@@ -178,18 +297,29 @@ class TrackedList(list):
             if hasattr(item, "_set_parent"):
                 item._set_parent(owner)
             # Enable tracking if owner has it enabled
-            if (
-                hasattr(owner, "_tracking_enabled")
-                and owner._tracking_enabled
-                and hasattr(item, "_tracking_enabled")
+            if getattr(owner, "_tracking_enabled", False) and hasattr(
+                item, "_enable_tracking"
             ):
-                object.__setattr__(item, "_tracking_enabled", True)
-                # Initialize dirty flags if not already set
-                # Use object.__getattribute__ to bypass tracked_getattribute
-                if object.__getattribute__(item, "_dirty_flags") is None:
-                    object.__setattr__(item, "_dirty_flags", {})
-                if object.__getattribute__(item, "_dirty_fields") is None:
-                    object.__setattr__(item, "_dirty_fields", {})
+                item._enable_tracking()
+
+    def _set_parents(self, items):
+        """Set parent references and enable tracking on a batch of items.
+
+        The owner and its tracking state are resolved once for the whole
+        batch instead of once per item. Used by extend() and +=; single
+        items go through _set_parent().
+        """
+        owner = self._owner_ref() if self._owner_ref else None
+        if not owner:
+            return
+        owner_tracking = getattr(owner, "_tracking_enabled", False)
+        for item in items:
+            # Set parent reference if supported
+            if hasattr(item, "_set_parent"):
+                item._set_parent(owner)
+            # Enable tracking if owner has it enabled
+            if owner_tracking and hasattr(item, "_enable_tracking"):
+                item._enable_tracking()
 
     def _sync_to_data(self, mark_dirty=True):
         """Convert all objects to dicts and update owner._data.
@@ -227,9 +357,11 @@ class TrackedList(list):
             items: Items to add
             mark_dirty: Whether to mark owner dirty. Set False when caching.
         """
-        for item in items:
-            self._set_parent(item)
+        # Materialize once so generators survive the parenting pass
+        items = list(items)
+        self._set_parents(items)
         super().extend(items)
+        # Single sync (and dirty propagation) for the whole batch
         self._sync_to_data(mark_dirty=mark_dirty)
 
     def insert(self, index, item):
@@ -260,8 +392,8 @@ class TrackedList(list):
         self._sync_to_data()
 
     def __iadd__(self, other):
-        for item in other:
-            self._set_parent(item)
+        other = list(other)
+        self._set_parents(other)
         result = super().__iadd__(other)
         self._sync_to_data()
         return result
@@ -294,10 +426,11 @@ class I18NDictionary(dict):
 
     def get_default(self):
         """Get the default value, or first value if no explicit default."""
-        if "dflt" in self:
-            return self["dflt"]
-        elif len(list(self.values())):
-            return list(self.values())[0]
+        value = self.get("dflt", _MISSING)
+        if value is not _MISSING:
+            return value
+        # First value without copying values() into a list (None if empty)
+        return next(iter(self.values()), None)
 
     def set_default(self, value):
         """Set the default value."""
@@ -336,14 +469,27 @@ class BaseObject:
         obj.items = items
     """
 
+    # Per-instance state lives in slots. Subclasses that declare an empty
+    # __slots__ (Node, Anchor, Guide) therefore carry no instance __dict__.
+    # _tracking_enabled controls tracking: when False, __setattr__ bypasses
+    # all dirty tracking for fast loading. Call initialize_dirty_tracking()
+    # to enable.
+    __slots__ = (
+        "_data",
+        "_tracking_enabled",
+        "_dirty_flags",
+        "_dirty_fields",
+        "_parent_ref",
+        "_user_data_snapshot",
+        "_skip_user_data_check",
+        "_dict_cache",
+        "__weakref__",
+    )
+
     # Field aliasing: Classes can define a _field_aliases dict mapping Python
     # field names to their serialized names in the file format.
     _field_aliases = {}
 
-    # Tracking control: When False, __setattr__ bypasses all dirty tracking
-    # for fast loading. Call initialize_dirty_tracking() to enable.
-    _tracking_enabled = False
-
     def __init__(self, _data=None, _validate=True, **kwargs):
         """
         Initialize with dict-backed storage.
@@ -362,33 +508,52 @@ class BaseObject:
             object.__setattr__(self, "_data", kwargs)
             data_to_validate = kwargs
 
-        # Validate required fields if _field_types is defined and validation enabled
-        if _validate and hasattr(self.__class__, "_field_types"):
-            for field_name, field_info in self.__class__._field_types.items():
-                is_required = isinstance(field_info, dict) and field_info.get(
-                    "required", False
-                )
-                if is_required:
-                    value = data_to_validate.get(field_name)
-                    if value is None:
-                        raise ValueError(
-                            f"{self.__class__.__name__}.{field_name} is a "
-                            f"required field and cannot be None"
-                        )
-                    # For string fields, also check for empty strings
-                    if field_info.get("data_type") == str and value == "":
-                        raise ValueError(
-                            f"{self.__class__.__name__}.{field_name} is a "
-                            f"required field and cannot be empty"
-                        )
+        # Validate required fields if validation enabled
+        if _validate:
+            for field_name, is_str in self._required_fields():
+                value = data_to_validate.get(field_name)
+                if value is None:
+                    raise ValueError(
+                        f"{self.__class__.__name__}.{field_name} is a "
+                        f"required field and cannot be None"
+                    )
+                # For string fields, also check for empty strings
+                if is_str and value == "":
+                    raise ValueError(
+                        f"{self.__class__.__name__}.{field_name} is a "
+                        f"required field and cannot be empty"
+                    )
+
+        # Initialize tracking infrastructure. Slots can't have class-level
+        # defaults, so each instance sets them; bind the setter once
+        set_slot = object.__setattr__
+        set_slot(self, "_tracking_enabled", False)
+        set_slot(self, "_dirty_flags", None)
+        set_slot(self, "_dirty_fields", None)
+        set_slot(self, "_parent_ref", None)
+        set_slot(self, "_user_data_snapshot", None)
+        set_slot(self, "_skip_user_data_check", False)
+        set_slot(self, "_dict_cache", None)
+
+    def _enable_tracking(self, wrap_user_data=False):
+        """
+        Enable dirty tracking on this object without touching its children.
 
-        # Initialize tracking infrastructure
-        object.__setattr__(self, "_tracking_enabled", False)
-        object.__setattr__(self, "_dirty_flags", None)
-        object.__setattr__(self, "_dirty_fields", None)
-        object.__setattr__(self, "_parent_ref", None)
-        object.__setattr__(self, "_user_data_snapshot", None)
-        object.__setattr__(self, "_skip_user_data_check", False)
+        Initializes the dirty mask (0 = clean, not None) and the dirty field
+        registry if tracking hasn't been set up yet. With wrap_user_data,
+        also converts a plain user_data dict to a TrackedDict now rather
+        than on first access; this is not a change, so nothing is marked.
+        """
+        object.__setattr__(self, "_tracking_enabled", True)
+        if object.__getattribute__(self, "_dirty_flags") is None:
+            object.__setattr__(self, "_dirty_flags", 0)
+        if object.__getattribute__(self, "_dirty_fields") is None:
+            object.__setattr__(self, "_dirty_fields", {})
+        if wrap_user_data:
+            _data = object.__getattribute__(self, "_data")
+            user_data = _data.get("_")
+            if type(user_data) is dict:
+                _data["_"] = TrackedDict(user_data, owner=self)
 
     @property
     def user_data(self):
@@ -419,6 +584,24 @@ class BaseObject:
     # Type checking for setters
     _field_types = {}
 
+    @classmethod
+    def _required_fields(cls):
+        """
+        Return (field_name, is_str) for each required field of this class.
+
+        Built from _field_types on first use and cached on the class itself,
+        so validating a new instance doesn't rescan the field rules.
+        """
+        plan = cls.__dict__.get("_required_fields_plan")
+        if plan is None:
+            plan = tuple(
+                (field_name, field_info.get("data_type") == str)
+                for field_name, field_info in cls._field_types.items()
+                if isinstance(field_info, dict) and field_info.get("required", False)
+            )
+            cls._required_fields_plan = plan
+        return plan
+
     @classmethod
     def _normalize_fields(cls, data_dict):
         """
@@ -537,74 +720,73 @@ class BaseObject:
         Mark this object as dirty in the given context(s).
 
         Args:
-            context: The context name or None for all standard contexts
+            context: A DIRTY_* flag (or several combined with |), a legacy
+                     context name such as "file_saving", or None for all
+                     standard contexts
             field_name: Optional specific field that changed
             propagate: Whether to propagate dirty flag to parent
         """
-        # Use object.__getattribute__ to bypass tracked_getattribute
-        dirty_flags = object.__getattribute__(self, "_dirty_flags")
-        if dirty_flags is None:
-            dirty_flags = {}
-            object.__setattr__(self, "_dirty_flags", dirty_flags)
-
         # If no context specified, mark for all standard contexts
         if context is None:
-            contexts = [DIRTY_FILE_SAVING, DIRTY_CANVAS_RENDER]
-        else:
-            contexts = [context]
-
-        for ctx in contexts:
-            # Check if already dirty in this context before propagating
-            was_already_dirty = dirty_flags.get(ctx, False)
-
-            dirty_flags[ctx] = True
-
-            if field_name:
-                dirty_fields = object.__getattribute__(self, "_dirty_fields")
-                if dirty_fields is None:
-                    dirty_fields = {}
-                    object.__setattr__(self, "_dirty_fields", dirty_fields)
-                if ctx not in dirty_fields:
-                    dirty_fields[ctx] = set()
-                dirty_fields[ctx].add(field_name)
-
-            # Only propagate if we weren't already dirty (prevents redundant calls)
-            # This makes mark_dirty idempotent for performance
-            if propagate and not was_already_dirty:
-                # Use object.__getattribute__ to bypass tracked_getattribute
-                parent_ref = object.__getattribute__(self, "_parent_ref")
-                if parent_ref is not None:
-                    parent = parent_ref()
-                    if parent is not None:
-                        parent.mark_dirty(ctx, propagate=True)
+            context = _DIRTY_DEFAULT
+        elif type(context) is str:
+            context = _legacy_dirty_context(context)
+
+        # Use object.__getattribute__ to bypass tracked_getattribute
+        dirty_flags = object.__getattribute__(self, "_dirty_flags") or 0
+
+        # Contexts we weren't already dirty in
+        newly_dirty = context & ~dirty_flags
+        object.__setattr__(self, "_dirty_flags", dirty_flags | context)
+
+        if field_name:
+            dirty_fields = object.__getattribute__(self, "_dirty_fields")
+            if dirty_fields is None:
+                dirty_fields = {}
+                object.__setattr__(self, "_dirty_fields", dirty_fields)
+            # Keyed by the int DIRTY_* bit: no tuple keys to build or hash
+            for ctx in _CONTEXTS_IN_MASK[context & _DIRTY_ALL]:
+                fields = dirty_fields.get(ctx)
+                if fields is None:
+                    dirty_fields[ctx] = {field_name}
+                else:
+                    fields.add(field_name)
+
+        # Only propagate contexts we weren't already dirty in (prevents
+        # redundant calls). This makes mark_dirty idempotent for performance
+        if propagate and newly_dirty:
+            # Use object.__getattribute__ to bypass tracked_getattribute
+            parent_ref = object.__getattribute__(self, "_parent_ref")
+            if parent_ref is not None:
+                parent = parent_ref()
+                if parent is not None:
+                    parent.mark_dirty(newly_dirty, propagate=True)
 
     def mark_clean(self, context=DIRTY_FILE_SAVING, recursive=False, build_cache=False):
         """
         Mark this object as clean in the given context.
 
         Args:
-            context: The context name to mark clean
+            context: The DIRTY_* flag(s) to mark clean
             recursive: Whether to recursively mark children clean
             build_cache: Whether to build dict cache proactively
         """
         # Lazy initialization: Initialize tracking if not yet done
-        # This happens when mark_clean is called recursively on children
-        if self._dirty_flags is None:
-            object.__setattr__(self, "_dirty_flags", {})
-        if self._dirty_fields is None:
-            object.__setattr__(self, "_dirty_fields", {})
-        # Enable tracking (needed for user_data change detection)
-        if hasattr(self, "_tracking_enabled") and not self._tracking_enabled:
-            object.__setattr__(self, "_tracking_enabled", True)
+        # This happens when mark_clean is called recursively on children.
+        # Tracking is also needed for user_data change detection
+        self._enable_tracking()
+        if type(context) is str:
+            context = _legacy_dirty_context(context)
 
         # Mark clean in this context
         if self._dirty_flags:
-            self._dirty_flags.pop(context, None)
-            # Keep as empty dict, don't set to None
-            # (None means tracking not initialized, {} means clean)
+            # Keep as 0, don't set to None
+            # (None means tracking not initialized, 0 means clean)
+            object.__setattr__(self, "_dirty_flags", self._dirty_flags & ~context)
 
         if self._dirty_fields:
-            self._dirty_fields.pop(context, None)
+            for ctx in _CONTEXTS_IN_MASK[context & _DIRTY_ALL]:
+                self._dirty_fields.pop(ctx, None)
             # Keep as empty dict, don't set to None
 
         # Proactively build dict cache when marking clean
@@ -628,11 +810,15 @@ class BaseObject:
         # Use object.__getattribute__ to bypass tracked_getattribute
         dirty_flags = object.__getattribute__(self, "_dirty_flags")
         if dirty_flags:
-            return dirty_flags.get(context, False)
+            if type(context) is str:
+                context = _legacy_dirty_context(context)
+            return bool(dirty_flags & context)
         return False
 
     def get_dirty_fields(self, context=DIRTY_FILE_SAVING):
         """Get the set of dirty fields for the given context."""
+        if type(context) is str:
+            context = _legacy_dirty_context(context)
         # Use object.__getattribute__ to bypass tracked_getattribute
         dirty_fields = object.__getattribute__(self, "_dirty_fields")
         if dirty_fields and context in dirty_fields:
@@ -767,9 +953,7 @@ class BaseObject:
             if name == "user_data":
                 # Convert regular dict to TrackedDict
                 if isinstance(value, dict) and not isinstance(value, TrackedDict):
-                    tracked = TrackedDict(owner=self)
-                    tracked.update(value)
-                    value = tracked
+                    value = TrackedDict(value, owner=self)
                 object.__setattr__(self, name, value)
                 # Mark dirty and snapshot (only if tracking enabled)
                 if tracking_enabled:
@@ -835,13 +1019,12 @@ class BaseObject:
 
                 if tracking_enabled:
                     # Lazy conversion: convert to TrackedDict on first access
-                    # Convert both empty and non-empty dicts for consistency
+                    # Convert both empty and non-empty dicts for consistency.
+                    # Store the converted copy directly in _data: the content is
+                    # unchanged, so reading must not mark the object dirty
                     if isinstance(value, dict) and not isinstance(value, TrackedDict):
-                        tracked = TrackedDict(owner=self)
-                        if value:  # Only update if non-empty
-                            tracked.update(value)
-                        object.__setattr__(self, "user_data", tracked)
-                        value = tracked
+                        value = TrackedDict(value, owner=self)
+                        object.__getattribute__(self, "_data")["_"] = value
 
                     # Check for nested changes (only if non-empty TrackedDict)
                     if value and isinstance(value, TrackedDict):
@@ -873,7 +1056,7 @@ class BaseObject:
                 if ix < len(v) - 1:
                     stream.write(b", ")
             stream.write(b"]")
-        elif isinstance(v, dict) and set(v.keys()) == {"x", "y", "angle"}:
+        elif isinstance(v, dict) and v.keys() == _POSITION_KEYS:
             # Position dict - serialize as [x, y, angle] list
             stream.write(b"[")
             stream.write(str(v["x"]).encode())
@@ -882,7 +1065,7 @@ class BaseObject:
             stream.write(b", ")
             stream.write(str(v["angle"]).encode())
             stream.write(b"]")
-        elif isinstance(v, dict) and set(v.keys()) == {"r", "g", "b", "a"}:
+        elif isinstance(v, dict) and v.keys() == _COLOR_KEYS:
             # Color dict - serialize as [r, g, b, a] list
             stream.write(b"[")
             stream.write(str(v["r"]).encode())
@@ -894,9 +1077,12 @@ class BaseObject:
             stream.write(str(v["a"]).encode())
             stream.write(b"]")
         elif isinstance(v, dict):
+            # Hoisted out of the loop: node dicts make this the hottest path
+            separate = self._should_separate_when_serializing(k)
+            last = len(v) - 1
             stream.write(b"{")
             for ix, (k1, v1) in enumerate(v.items()):
-                if self._should_separate_when_serializing(k):
+                if separate:
                     stream.write(b"\n")
                     stream.write(b"  " * (indent + 2))
                 if not isinstance(k1, str):
@@ -906,19 +1092,21 @@ class BaseObject:
                     self._write_value(stream, k, k1, indent + 1)
                 stream.write(b": ")
                 self._write_value(stream, k, v1, indent + 1)
-                if ix < len(v.items()) - 1:
+                if ix < last:
                     stream.write(b", ")
             stream.write(b"}")
         elif isinstance(v, list):
+            separate = self._should_separate_when_serializing(k)
+            last = len(v) - 1
             stream.write(b"[")
             for ix, item in enumerate(v):
-                if self._should_separate_when_serializing(k):
+                if separate:
                     stream.write(b"\n")
                     stream.write(b"  " * (indent + 2))
                 self._write_value(stream, k, item, indent + 1)
-                if ix < len(v) - 1:
+                if ix < last:
                     stream.write(b", ")
-            if self._should_separate_when_serializing(k):
+            if separate:
                 stream.write(b"\n")
                 stream.write(b"  " * (indent + 1))
             stream.write(b"]")
@@ -968,7 +1156,11 @@ class BaseObject:
             if ix != len(towrite) - 1:
                 stream.write(b", ")
 
-        if self.user_data:
+        # Read the raw stored value: the tracked user_data property would
+        # wrap it in a TrackedDict and re-serialize it to check for nested
+        # changes, neither of which writing needs
+        user_data = self._data.get("_")
+        if user_data:
             stream.write(b",")
             if not self._write_one_line:
                 stream.write(b"\n")
@@ -977,7 +1169,7 @@ class BaseObject:
             if self._write_one_line:
                 stream.write(
                     orjson.dumps(
-                        self.user_data,
+                        user_data,
                         option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
                     )
                 )
@@ -985,7 +1177,7 @@ class BaseObject:
                 stream.write(b"\n")
                 stream.write(
                     orjson.dumps(
-                        self.user_data,
+                        user_data,
                         option=orjson.OPT_INDENT_2
                         | orjson.OPT_SORT_KEYS
                         | orjson.OPT_NON_STR_KEYS,
@@ -998,6 +1190,17 @@ class BaseObject:
         if not self._write_one_line:
             stream.write(b"\n")
 
+    def write_bytes(self, indent=0):
+        """
+        Return the serialized file format of this object as bytes.
+
+        Equivalent to write() into a BytesIO; getvalue() hands back the
+        buffer without another copy.
+        """
+        stream = io.BytesIO()
+        self.write(stream, indent)
+        return stream.getvalue()
+
     def _convert_value_to_dict(self, v):
         """Convert a value to a dict-compatible representation."""
         if hasattr(v, "to_dict"):
@@ -1027,6 +1230,20 @@ class BaseObject:
         """
         Return dictionary representation.
 
+        Always rebuilt: an object being clean for DIRTY_FILE_SAVING doesn't
+        prove its children are unchanged (edits with tracking disabled or
+        propagate=False never reach it), so the output isn't cached.
+        Subclasses customize _to_dict_no_cache() instead.
+
+        Returns:
+            dict: Plain dictionary representation (no TrackedDict objects)
+        """
+        return self._to_dict_no_cache()
+
+    def _to_dict_no_cache(self):
+        """
+        Build the dictionary representation returned by to_dict().
+
         _data contains ONLY serializable data (dicts, lists, primitives).
         However, when dirty tracking is enabled, _data becomes a TrackedDict
         with shared references to other TrackedDict objects. We must convert
@@ -401,18 +401,12 @@ class Font(BaseObject):
             Initialize tracking on an object without recursing to children.
             Children will be initialized lazily when accessed.
             """
-            if not hasattr(obj, "_tracking_enabled"):
+            if not hasattr(obj, "_enable_tracking"):
                 return
 
-            # Enable tracking for this object
-            object.__setattr__(obj, "_tracking_enabled", True)
-
-            # Initialize dirty flags as empty dicts (not None)
-            # This is the signal that tracking is active
-            if obj._dirty_flags is None:
-                object.__setattr__(obj, "_dirty_flags", {})
-            if obj._dirty_fields is None:
-                object.__setattr__(obj, "_dirty_fields", {})
+            # Enable tracking for this object. The empty dirty mask (not
+            # None) is the signal that tracking is active
+            obj._enable_tracking()
 
             # LAZY: Don't convert user_data, create snapshots, or recurse!
             # Everything happens on-demand:
@@ -614,18 +608,18 @@ class Font(BaseObject):
 
     def write(self, stream, indent=0):
         """Override write to sync cached objects to _data before serialization."""
-        # Sync masters: convert cached Master objects back to dicts
+        # SHARED REFS: point _data at the cached objects' own dicts (as
+        # TrackedList does) instead of building a to_dict() copy of each
         if self._masters_cache is not None:
-            self._data["masters"] = [m.to_dict() for m in self._masters_cache]
+            self._data["masters"] = [m._data for m in self._masters_cache]
 
-        # Sync instances: convert cached Instance objects back to dicts
         if self._instances_cache is not None:
-            self._data["instances"] = [i.to_dict() for i in self._instances_cache]
+            self._data["instances"] = [i._data for i in self._instances_cache]
 
         # Call parent write()
         super().write(stream, indent)
 
-    def to_dict(self):
+    def _to_dict_no_cache(self):
         """
         Convert the entire font to a dictionary representation.
         This creates a complete babelfont-compatible dictionary including
@@ -636,7 +630,7 @@ class Font(BaseObject):
             dict: A complete dictionary representation of the font
         """
         # Start with base object dictionary (top-level font properties)
-        result = super().to_dict()
+        result = super()._to_dict_no_cache()
 
         # Add names dictionary
         result["names"] = self.names.to_dict()
@@ -811,14 +805,17 @@ class Font(BaseObject):
 
     @functools.cached_property
     def _all_kerning(self):
-        all_keys = [set(m.kerning.keys()) for m in self.masters]
+        # Master.kerning builds a new tuple-keyed dict on every access,
+        # so fetch it once per master rather than once per pair
+        master_kerning = [(m, m.kerning) for m in self.masters]
+        all_keys = set().union(*(kerning.keys() for _, kerning in master_kerning))
         kerndict = {}
-        for left, right in list(set().union(*all_keys)):
+        for left, right in all_keys:
             kern = VariableScalar()
             kern.axes = self.axes
-            for m in self.masters:
-                thiskern = m.kerning.get((left, right), 0)
-                if (left, right) not in m.kerning:
+            for m, kerning in master_kerning:
+                thiskern = kerning.get((left, right), 0)
+                if (left, right) not in kerning:
                     log.debug(
                         "Master %s did not define a kern pair for (%s, %s), using 0",
                         m.name.get_default(),
@@ -1,4 +1,5 @@
 import os
+from typing import Iterator
 
 from .BaseObject import BaseObject
 from .Layer import Layer
@@ -216,13 +217,8 @@ class GlyphList(dict):
                 thing._set_parent(font)
                 # Enable tracking if font has it enabled
                 if hasattr(font, "_tracking_enabled") and font._tracking_enabled:
-                    if hasattr(thing, "_tracking_enabled"):
-                        object.__setattr__(thing, "_tracking_enabled", True)
-                        # Initialize dirty flags if not already set
-                        if thing._dirty_flags is None:
-                            object.__setattr__(thing, "_dirty_flags", {})
-                        if thing._dirty_fields is None:
-                            object.__setattr__(thing, "_dirty_fields", {})
+                    if hasattr(thing, "_enable_tracking"):
+                        thing._enable_tracking()
 
         self[thing.name] = thing
 
@@ -247,15 +243,8 @@ class GlyphList(dict):
                 stream.write(b"\n")
         stream.write(b"]")
 
-    def __iter__(self) -> "GlyphList":
-        self._n = 0
-        self._values = list(self.values())
-        return self
-
-    def __next__(self) -> Glyph:
-        if self._n < len(self._values):
-            result = self._values[self._n]
-            self._n += 1
-            return result
-        else:
-            raise StopIteration
+    def __iter__(self) -> Iterator[Glyph]:
+        # Iterate a snapshot, so glyphs can be added or removed mid-loop,
+        # through a fresh C-level iterator: nested loops over the same list
+        # don't share (and reset) iteration state
+        return iter(list(self.values()))
@@ -1,9 +1,36 @@
-from .BaseObject import BaseObject, Color, Position
+from .BaseObject import _COLOR_KEYS, _POSITION_KEYS, BaseObject, Color, Position
+
+
+def _position_to_dict(value):
+    """Coerce a Position, list or tuple to the stored position dict."""
+    # Exact-type check first: Position is by far the most common input
+    # and is itself a tuple, so it must be handled before the generic case
+    if type(value) is Position:
+        x, y, angle = value
+        return {"x": x, "y": y, "angle": angle}
+    if isinstance(value, (list, tuple)):
+        angle = value[2] if len(value) > 2 else 0
+        return {"x": value[0], "y": value[1], "angle": angle}
+    return value
+
+
+def _color_to_dict(value):
+    """Coerce a Color, list or tuple to the stored color dict."""
+    if type(value) is Color:
+        r, g, b, a = value
+        return {"r": r, "g": g, "b": b, "a": a}
+    if isinstance(value, (list, tuple)) and value:
+        a = value[3] if len(value) > 3 else 0
+        return {"r": value[0], "g": value[1], "b": value[2], "a": a}
+    return value
 
 
 class Guide(BaseObject):
     """A guide line in a glyph or master."""
 
+    # No per-instance __dict__: all state lives in BaseObject's slots
+    __slots__ = ()
+
     # Map Python field names to their serialized names in files
     _field_aliases = {"position": "pos"}
 
@@ -26,26 +53,8 @@ class Guide(BaseObject):
             super().__init__(_data=_data)
         else:
             # Convert Position/Color to dict if needed
-            if isinstance(position, Position):
-                position = {
-                    "x": position.x,
-                    "y": position.y,
-                    "angle": position.angle,
-                }
-            elif isinstance(position, (list, tuple)):
-                angle = position[2] if len(position) > 2 else 0
-                position = {"x": position[0], "y": position[1], "angle": angle}
-
-            if isinstance(color, Color):
-                color = {
-                    "r": color.r,
-                    "g": color.g,
-                    "b": color.b,
-                    "a": color.a,
-                }
-            if isinstance(color, (list, tuple)) and color:
-                a = color[3] if len(color) > 3 else 0
-                color = {"r": color[0], "g": color[1], "b": color[2], "a": a}
+            position = _position_to_dict(position)
+            color = _color_to_dict(color)
 
             # Store using file format name ("pos" instead of "position")
             data = {"pos": position, "name": name, "color": color}
@@ -58,6 +67,10 @@ class Guide(BaseObject):
         pos = self._data.get("pos")
         if pos:
             if isinstance(pos, dict):
+                if pos.keys() == _POSITION_KEYS:
+                    # Positional construction avoids building a kwargs dict
+                    return Position(pos["x"], pos["y"], pos["angle"])
+                # Partial dicts use the namedtuple defaults; unknown keys raise
                 return Position(**pos)
             elif isinstance(pos, (list, tuple)):
                 # From JSON: [x, y, angle]
@@ -67,11 +80,7 @@ class Guide(BaseObject):
 
     @position.setter
     def position(self, value):
-        if isinstance(value, Position):
-            value = {"x": value.x, "y": value.y, "angle": value.angle}
-        elif isinstance(value, (list, tuple)):
-            angle = value[2] if len(value) > 2 else 0
-            value = {"x": value[0], "y": value[1], "angle": angle}
+        value = _position_to_dict(value)
 
         # Validate that x and y are integers if value is a dict
         if isinstance(value, dict):
@@ -97,6 +106,8 @@ class Guide(BaseObject):
         col = self._data.get("color")
         if col:
             if isinstance(col, dict):
+                if col.keys() == _COLOR_KEYS:
+                    return Color(col["r"], col["g"], col["b"], col["a"])
                 return Color(**col)
             elif isinstance(col, (list, tuple)):
                 # From JSON: [r, g, b, a]
@@ -106,9 +117,5 @@ class Guide(BaseObject):
 
     @color.setter
     def color(self, value):
-        if isinstance(value, Color):
-            value = {"r": value.r, "g": value.g, "b": value.b, "a": value.a}
-        elif isinstance(value, (list, tuple)) and value:
-            a = value[3] if len(value) > 3 else 0
-            value = {"r": value[0], "g": value[1], "b": value[2], "a": a}
+        value = _color_to_dict(value)
         self._set_field("color", value)
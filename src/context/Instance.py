@@ -5,6 +5,9 @@ from .Names import Names
 class Instance(BaseObject):
     """An object representing a named or static instance."""
 
+    # No per-instance __dict__: all state lives in BaseObject's slots
+    __slots__ = ()
+
     _write_one_line = True
 
     def __init__(
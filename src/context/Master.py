@@ -1,7 +1,7 @@
 from typing import Optional, Union
 
 from .Layer import Layer
-from .BaseObject import BaseObject, I18NDictionary
+from .BaseObject import BaseObject, I18NDictionary, _MISSING
 from .Guide import Guide
 
 # Anything which can be varied in MVAR is a master-specific metric
@@ -203,34 +203,40 @@ class Master(BaseObject):
         if not kerning_data:
             return {}
 
-        # Convert string keys to tuples for user access (DON'T modify _data)
-        kerning = {}
-        for k, v in kerning_data.items():
-            if isinstance(k, tuple):
-                # Already a tuple (shouldn't happen, but be safe)
-                kerning[k] = v
-            else:
-                # Convert from string format "a//b" to tuple ("a", "b")
-                kerning[tuple(k.split("//"))] = v
-        return kerning
+        # Convert string keys "a//b" to tuples ("a", "b") for user access
+        # (DON'T modify _data). Tuple keys shouldn't happen, but be safe.
+        return {
+            k if isinstance(k, tuple) else tuple(k.split("//")): v
+            for k, v in kerning_data.items()
+        }
 
     @kerning.setter
     def kerning(self, value):
         # Convert kerning tuple keys to string format for JSON serialization
         if value:
-            kerning = {}
-            for k, v in value.items():
-                # Convert tuple ("a", "b") to string "a//b"
-                if isinstance(k, tuple):
-                    kerning["//".join(k)] = v
-                else:
-                    kerning[k] = v
-            self._data["kerning"] = kerning
-        else:
-            self._data["kerning"] = value
+            value = {
+                "//".join(k) if isinstance(k, tuple) else k: v for k, v in value.items()
+            }
+        self._data["kerning"] = value
         if self._tracking_enabled:
             self.mark_dirty(field_name="kerning")
 
+    def get_kerning(self, left, right, default=0):
+        """
+        Return the kerning value for one pair.
+
+        Looks the pair up in _data directly, instead of building the whole
+        tuple-keyed dict that the kerning property returns.
+        """
+        kerning_data = self._data.get("kerning")
+        if not kerning_data:
+            return default
+        value = kerning_data.get("//".join((left, right)), _MISSING)
+        if value is _MISSING:
+            # Kerning passed to __init__ is stored with tuple keys as given
+            value = kerning_data.get((left, right), default)
+        return value
+
     @property
     def font(self):
         """Get font via weak reference (back-reference)."""
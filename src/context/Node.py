@@ -1,9 +1,17 @@
+import sys
+
 import orjson
 from .BaseObject import BaseObject
 
 TO_PEN_TYPE = {"o": None, "c": "curve", "l": "line", "q": "qcurve"}
 FROM_PEN_TYPE = {v: k for k, v in TO_PEN_TYPE.items()}
 
+# Node types parsed from files are fresh strings; intern them so all nodes
+# of a type share one string object
+_INTERNED_TYPES = {
+    t: sys.intern(t) for t in ("o", "os", "c", "cs", "l", "ls", "q", "qs")
+}
+
 # Checked status: OK Yanone November 5th 2025
 
 
@@ -12,6 +20,9 @@ class Node(BaseObject):
     A node in a glyph outline path.
     """
 
+    # No per-instance __dict__: all state lives in BaseObject's slots
+    __slots__ = ()
+
     # Define validation rules for each field
     _field_types = {
         "x": {
@@ -24,7 +35,7 @@ class Node(BaseObject):
         },
         "type": {
             "data_type": str,
-            "allowed_values": ["o", "os", "c", "cs", "l", "ls", "q", "qs"],
+            "allowed_values": list(_INTERNED_TYPES),
             "required": True,
         },
     }
@@ -36,7 +47,7 @@ class Node(BaseObject):
             super().__init__(_data=_data, _validate=_validate)
         else:
             # Normal construction: build dict from parameters
-            data = {"x": x, "y": y, "type": type}
+            data = {"x": x, "y": y, "type": _INTERNED_TYPES.get(type, type)}
             data.update(kwargs)
             super().__init__(_data=data, _validate=_validate)
 
@@ -98,18 +109,20 @@ class Node(BaseObject):
 
     @type.setter
     def type(self, value):
-        self._set_field("type", value)
+        self._set_field("type", _INTERNED_TYPES.get(value, value))
 
     def write(self, stream, _indent):
-        # Check if there's any user data to write
-        if not self.user_data:
+        # Check if there's any user data to write. Read the raw stored value,
+        # so serializing doesn't wrap it in a TrackedDict
+        user_data = self._data.get("_")
+        if not user_data:
             node_str = '[%i,%i,"%s"]' % (self.x, self.y, self.type)
             stream.write(node_str.encode())
         else:
             # Serialize user_data as JSON string with sorted keys
             # OPT_NON_STR_KEYS: Allow non-string dict keys
             userdata_str = orjson.dumps(
-                self.user_data,
+                user_data,
                 option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
             ).decode()
             node_str = '[%i,%i,"%s",%s]' % (
@@ -62,6 +62,23 @@ class Shape(BaseObject):
         # Initialize nodes cache
         object.__setattr__(self, "_nodes_cache", None)
 
+    @classmethod
+    def from_node_tuples(cls, node_tuples, closed=True, **kwargs):
+        """
+        Create a path Shape from node tuples.
+
+        Args:
+            node_tuples: Iterable of (x, y, type) or (x, y, type, userdata)
+            closed: Whether the path is closed
+            **kwargs: Further Shape fields, e.g. ``_`` for format-specific data
+
+        Returns:
+            Shape instance. Node objects are only created (and linked to the
+            shape) when ``shape.nodes`` is first accessed.
+        """
+        nodes = [Node.from_dict(list(node))._data for node in node_tuples]
+        return cls(nodes=nodes, closed=closed, **kwargs)
+
     @property
     def ref(self):
         return self._data.get("ref")
@@ -98,10 +115,10 @@ class Shape(BaseObject):
 
         # Convert dicts to Node objects (no deepcopy needed for _data)
         nodes_objects = [Node.from_dict(n, _copy=False) for n in nodes_data]
+        tracking_enabled = object.__getattribute__(self, "_tracking_enabled")
         for node in nodes_objects:
             node._set_parent(self)
             # Enable tracking if parent has it enabled
-            tracking_enabled = object.__getattribute__(self, "_tracking_enabled")
             if tracking_enabled:
                 object.__setattr__(node, "_tracking_enabled", True)
 
@@ -156,15 +173,6 @@ class Shape(BaseObject):
         # Nothing to do here - just let lazy initialization happen later
         pass
 
-    def write(self, stream, indent=0):
-        """Override write to ensure nodes are Node objects."""
-        # Access nodes property to trigger conversion if needed
-        if self._data.get("nodes"):
-            # This will convert dicts/lists to Node objects
-            _ = self.nodes
-        # Now call parent write() which will use Node.write()
-        super().write(stream, indent)
-
     @property
     def _write_one_line(self):
         return self.is_component
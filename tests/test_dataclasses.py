@@ -1,4 +1,4 @@
-from context import Axis, Glyph
+from context import Axis, Font, Glyph
 from io import BytesIO
 
 def test_propagate_format_specific():
@@ -12,3 +12,17 @@ def test_write_a_negative():
     g.write(s)
     assert "exported" in s.getvalue().decode()
 
+
+def test_write_bytes_matches_write():
+    g = Glyph(name="A", codepoints=[65], _={"com.test": "value"})
+    s = BytesIO()
+    g.write(s)
+    assert g.write_bytes() == s.getvalue()
+
+
+def test_glyph_list_nested_iteration():
+    font = Font()
+    for name in ("A", "B", "C"):
+        font.glyphs.append(Glyph(name=name))
+    pairs = [(g1.name, g2.name) for g1 in font.glyphs for g2 in font.glyphs]
+    assert len(pairs) == 9
@@ -1,7 +1,7 @@
 """Tests for dirty tracking functionality in context-py."""
 
 import pytest
-from context import load, DIRTY_FILE_SAVING, DIRTY_CANVAS_RENDER
+from context import load, DIRTY_FILE_SAVING, DIRTY_CANVAS_RENDER, DIRTY_UNDO
 from context.Font import Font
 from context.Glyph import Glyph
 from context.Layer import Layer
@@ -167,6 +167,38 @@ class TestMultipleContexts:
         assert glyph.is_dirty(DIRTY_FILE_SAVING)
         assert not glyph.is_dirty(DIRTY_CANVAS_RENDER)
 
+    def test_combined_contexts(self, simple_font):
+        """Contexts can be combined into one mask with |."""
+        glyph = simple_font.glyphs["A"]
+
+        glyph.mark_dirty(DIRTY_FILE_SAVING | DIRTY_UNDO, field_name="width")
+        assert glyph.is_dirty(DIRTY_FILE_SAVING)
+        assert glyph.is_dirty(DIRTY_UNDO)
+        assert not glyph.is_dirty(DIRTY_CANVAS_RENDER)
+        assert glyph.get_dirty_fields(DIRTY_UNDO) == {"width"}
+        # Only the newly dirty contexts propagate to the parent
+        assert simple_font.is_dirty(DIRTY_UNDO)
+
+        glyph.mark_clean(DIRTY_FILE_SAVING | DIRTY_UNDO)
+        assert not glyph.is_dirty(DIRTY_FILE_SAVING | DIRTY_UNDO)
+        assert glyph.get_dirty_fields(DIRTY_UNDO) == set()
+
+
+    def test_legacy_string_contexts(self, simple_font):
+        """The old string context names are still accepted."""
+        glyph = simple_font.glyphs["A"]
+
+        glyph.mark_dirty("undo", field_name="width")
+        assert glyph.is_dirty(DIRTY_UNDO)
+        assert glyph.is_dirty("undo")
+        assert glyph.get_dirty_fields("undo") == {"width"}
+
+        glyph.mark_clean("undo")
+        assert not glyph.is_dirty(DIRTY_UNDO)
+
+        with pytest.raises(ValueError):
+            glyph.mark_dirty("no_such_context")
+
 
 class TestFieldTracking:
     """Test field-level dirty tracking."""
@@ -304,6 +336,49 @@ class TestRecursiveCleaning:
         assert layer.is_dirty(DIRTY_FILE_SAVING)
 
 
+class TestToDictFreshness:
+    """Test that to_dict() reflects the current state in every flow."""
+
+    def test_repeated_edit_after_parent_cleaned(self, simple_font):
+        """A second edit to a still-dirty child shows up after the font is cleaned."""
+        layer = simple_font.glyphs["A"].layers[0]
+        layer.width = 700
+        # As Font.save() does: clean the font only, children stay dirty
+        simple_font.mark_clean(DIRTY_FILE_SAVING, recursive=False)
+        assert simple_font.to_dict()["glyphs"][0]["layers"][0]["width"] == 700
+
+        layer.width = 800
+        assert simple_font.to_dict()["glyphs"][0]["layers"][0]["width"] == 800
+
+    def test_edit_with_tracking_disabled(self, simple_font):
+        """Edits made while tracking is off are still serialized."""
+        simple_font.to_dict()
+        layer = simple_font.glyphs["A"].layers[0]
+        layer._tracking_enabled = False
+        layer.width = 900
+
+        assert simple_font.to_dict()["glyphs"][0]["layers"][0]["width"] == 900
+
+    def test_edit_without_propagation(self, simple_font):
+        """Edits marked dirty with propagate=False are still serialized."""
+        simple_font.to_dict()
+        layer = simple_font.glyphs["A"].layers[0]
+        layer._data["width"] = 950
+        layer.mark_dirty(DIRTY_FILE_SAVING, field_name="width", propagate=False)
+
+        assert simple_font.to_dict()["glyphs"][0]["layers"][0]["width"] == 950
+
+    def test_mutating_result_does_not_leak(self, simple_font):
+        """Changing a returned dict, even nested parts, doesn't affect the next one."""
+        font_dict = simple_font.to_dict()
+        font_dict["glyphs"].clear()
+        font_dict["names"]["familyName"] = {"en": "Changed"}
+
+        font_dict = simple_font.to_dict()
+        assert len(font_dict["glyphs"]) == len(simple_font.glyphs)
+        assert font_dict["names"]["familyName"] != {"en": "Changed"}
+
+
 class TestShapeAndNodeTracking:
     """Test dirty tracking with shapes and nodes."""
 
@@ -4,9 +4,22 @@ Input validation tests for context classes.
 Tests type checking and allowed values for property setters.
 """
 
+import re
+
 import pytest
 from context import Anchor, Guide, Layer, Node, Shape
 
+# Compiled once and shared by every (parametrized) case below
+_MUST_BE_INT = re.compile("must be int")
+_MUST_BE_STR = re.compile("must be str")
+_MUST_BE_BOOL = re.compile("must be bool")
+_MUST_BE_ONE_OF = re.compile("must be one of")
+_MUST_BE = re.compile("must be")
+_REQUIRED_NOT_NONE = re.compile("required field and cannot be None")
+_REQUIRED_NOT_EMPTY = re.compile("required field and cannot be empty")
+_POSITION_X_INT = re.compile("Position x must be int")
+_POSITION_Y_INT = re.compile("Position y must be int")
+
 
 class TestNodeValidation:
     """Test Node property validation."""
@@ -19,13 +32,12 @@ class TestNodeValidation:
         node.x = -50
         assert node.x == -50
 
-    def test_x_rejects_invalid_types(self):
+    @pytest.mark.parametrize("bad", [100.5, "100"])
+    def test_x_rejects_invalid_types(self, bad):
         """x should reject non-integer types."""
         node = Node()
-        with pytest.raises(ValueError, match="must be int"):
-            node.x = 100.5
-        with pytest.raises(ValueError, match="must be int"):
-            node.x = "100"
+        with pytest.raises(ValueError, match=_MUST_BE_INT):
+            node.x = bad
 
     def test_y_accepts_valid_int(self):
         """y should accept integer values including negatives."""
@@ -35,13 +47,12 @@ class TestNodeValidation:
         node.y = -100
         assert node.y == -100
 
-    def test_y_rejects_invalid_types(self):
+    @pytest.mark.parametrize("bad", [200.75, "200"])
+    def test_y_rejects_invalid_types(self, bad):
         """y should reject non-integer types."""
         node = Node()
-        with pytest.raises(ValueError, match="must be int"):
-            node.y = 200.75
-        with pytest.raises(ValueError, match="must be int"):
-            node.y = "200"
+        with pytest.raises(ValueError, match=_MUST_BE_INT):
+            node.y = bad
 
     def test_type_accepts_valid_values(self):
         """type should accept all valid short-form node types."""
@@ -51,42 +62,42 @@ class TestNodeValidation:
             node.type = node_type
             assert node.type == node_type
 
-    def test_type_rejects_invalid_values(self):
+    # "line" is the long form, which is not allowed
+    @pytest.mark.parametrize("bad", ["invalid", "line"])
+    def test_type_rejects_invalid_values(self, bad):
         """type should reject invalid node type values."""
         node = Node()
-        with pytest.raises(ValueError, match="must be one of"):
-            node.type = "invalid"
-        with pytest.raises(ValueError, match="must be one of"):
-            node.type = "line"  # Long form not allowed
+        with pytest.raises(ValueError, match=_MUST_BE_ONE_OF):
+            node.type = bad
 
     def test_type_rejects_invalid_types(self):
         """type should reject non-string types."""
         node = Node()
-        with pytest.raises(ValueError, match="must be str"):
+        with pytest.raises(ValueError, match=_MUST_BE_STR):
             node.type = 123
 
     def test_x_rejects_none(self):
         """x is a required field and should reject None."""
         node = Node()
-        with pytest.raises(ValueError, match="required field and cannot be None"):
+        with pytest.raises(ValueError, match=_REQUIRED_NOT_NONE):
             node.x = None
 
     def test_y_rejects_none(self):
         """y is a required field and should reject None."""
         node = Node()
-        with pytest.raises(ValueError, match="required field and cannot be None"):
+        with pytest.raises(ValueError, match=_REQUIRED_NOT_NONE):
             node.y = None
 
     def test_type_rejects_none(self):
         """type is a required field and should reject None."""
         node = Node()
-        with pytest.raises(ValueError, match="required field and cannot be None"):
+        with pytest.raises(ValueError, match=_REQUIRED_NOT_NONE):
             node.type = None
 
     def test_type_rejects_empty_string(self):
         """type is a required field and should reject empty string."""
         node = Node()
-        with pytest.raises(ValueError, match="required field and cannot be empty"):
+        with pytest.raises(ValueError, match=_REQUIRED_NOT_EMPTY):
             node.type = ""
 
 
@@ -101,13 +112,12 @@ class TestGuideValidation:
         guide.name = ""
         assert guide.name == ""
 
-    def test_name_rejects_invalid_types(self):
+    @pytest.mark.parametrize("bad", [123, None])
+    def test_name_rejects_invalid_types(self, bad):
         """name should reject non-string types."""
         guide = Guide()
-        with pytest.raises(ValueError, match="must be str"):
-            guide.name = 123
-        with pytest.raises(ValueError, match="must be str"):
-            guide.name = None
+        with pytest.raises(ValueError, match=_MUST_BE_STR):
+            guide.name = bad
 
     def test_position_accepts_valid_types(self):
         """position should accept Position/dict/list/tuple with integer x/y."""
@@ -128,22 +138,21 @@ class TestGuideValidation:
         guide.position = {"x": 200, "y": 300, "angle": 0}
         assert guide.position.x == 200
 
-    def test_position_rejects_invalid_types(self):
+    @pytest.mark.parametrize("bad", ["invalid", 123])
+    def test_position_rejects_invalid_types(self, bad):
         """position should reject invalid types."""
         guide = Guide()
-        with pytest.raises(ValueError, match="must be"):
-            guide.position = "invalid"
-        with pytest.raises(ValueError, match="must be"):
-            guide.position = 123
+        with pytest.raises(ValueError, match=_MUST_BE):
+            guide.position = bad
 
     def test_position_rejects_float_coordinates(self):
         """position should reject float x/y coordinates."""
         guide = Guide()
         # Dict with float x
-        with pytest.raises(ValueError, match="Position x must be int"):
+        with pytest.raises(ValueError, match=_POSITION_X_INT):
             guide.position = {"x": 100.5, "y": 200, "angle": 0}
         # Dict with float y
-        with pytest.raises(ValueError, match="Position y must be int"):
+        with pytest.raises(ValueError, match=_POSITION_Y_INT):
             guide.position = {"x": 100, "y": 200.5, "angle": 0}
 
     def test_color_accepts_valid_types(self):
@@ -165,13 +174,12 @@ class TestGuideValidation:
         guide.color = {"r": 0, "g": 0, "b": 255, "a": 200}
         assert guide.color.b == 255
 
-    def test_color_rejects_invalid_types(self):
+    @pytest.mark.parametrize("bad", ["invalid", 123])
+    def test_color_rejects_invalid_types(self, bad):
         """color should reject invalid types."""
         guide = Guide()
-        with pytest.raises(ValueError, match="must be"):
-            guide.color = "invalid"
-        with pytest.raises(ValueError, match="must be"):
-            guide.color = 123
+        with pytest.raises(ValueError, match=_MUST_BE):
+            guide.color = bad
 
 
 class TestAnchorValidation:
@@ -185,13 +193,12 @@ class TestAnchorValidation:
         anchor.name = ""
         assert anchor.name == ""
 
-    def test_name_rejects_invalid_types(self):
+    @pytest.mark.parametrize("bad", [123, None])
+    def test_name_rejects_invalid_types(self, bad):
         """name should reject non-string types."""
         anchor = Anchor()
-        with pytest.raises(ValueError, match="must be str"):
-            anchor.name = 123
-        with pytest.raises(ValueError, match="must be str"):
-            anchor.name = None
+        with pytest.raises(ValueError, match=_MUST_BE_STR):
+            anchor.name = bad
 
     def test_x_accepts_valid_int(self):
         """x should accept integer values including negatives."""
@@ -203,15 +210,12 @@ class TestAnchorValidation:
         anchor.x = 0
         assert anchor.x == 0
 
-    def test_x_rejects_invalid_types(self):
+    @pytest.mark.parametrize("bad", [100.5, "100", None])
+    def test_x_rejects_invalid_types(self, bad):
         """x should reject non-integer types including floats."""
         anchor = Anchor()
-        with pytest.raises(ValueError, match="must be int"):
-            anchor.x = 100.5
-        with pytest.raises(ValueError, match="must be int"):
-            anchor.x = "100"
-        with pytest.raises(ValueError, match="must be int"):
-            anchor.x = None
+        with pytest.raises(ValueError, match=_MUST_BE_INT):
+            anchor.x = bad
 
     def test_y_accepts_valid_int(self):
         """y should accept integer values including negatives."""
@@ -223,15 +227,12 @@ class TestAnchorValidation:
         anchor.y = 0
         assert anchor.y == 0
 
-    def test_y_rejects_invalid_types(self):
+    @pytest.mark.parametrize("bad", [200.75, "200", None])
+    def test_y_rejects_invalid_types(self, bad):
         """y should reject non-integer types including floats."""
         anchor = Anchor()
-        with pytest.raises(ValueError, match="must be int"):
-            anchor.y = 200.75
-        with pytest.raises(ValueError, match="must be int"):
-            anchor.y = "200"
-        with pytest.raises(ValueError, match="must be int"):
-            anchor.y = None
+        with pytest.raises(ValueError, match=_MUST_BE_INT):
+            anchor.y = bad
 
 
 class TestShapeValidation:
@@ -245,13 +246,12 @@ class TestShapeValidation:
         shape.ref = ""
         assert shape.ref == ""
 
-    def test_ref_rejects_invalid_types(self):
+    @pytest.mark.parametrize("bad", [123, None])
+    def test_ref_rejects_invalid_types(self, bad):
         """ref should reject non-string types."""
         shape = Shape()
-        with pytest.raises(ValueError, match="must be str"):
-            shape.ref = 123
-        with pytest.raises(ValueError, match="must be str"):
-            shape.ref = None
+        with pytest.raises(ValueError, match=_MUST_BE_STR):
+            shape.ref = bad
 
     def test_closed_accepts_valid_bool(self):
         """closed should accept boolean values."""
@@ -261,13 +261,12 @@ class TestShapeValidation:
         shape.closed = False
         assert shape.closed is False
 
-    def test_closed_rejects_invalid_types(self):
+    @pytest.mark.parametrize("bad", [1, "True"])
+    def test_closed_rejects_invalid_types(self, bad):
         """closed should reject non-boolean types."""
         shape = Shape()
-        with pytest.raises(ValueError, match="must be bool"):
-            shape.closed = 1
-        with pytest.raises(ValueError, match="must be bool"):
-            shape.closed = "True"
+        with pytest.raises(ValueError, match=_MUST_BE_BOOL):
+            shape.closed = bad
 
     def test_direction_accepts_valid_values(self):
         """direction should accept 1 or -1."""
@@ -277,21 +276,19 @@ class TestShapeValidation:
         shape.direction = -1
         assert shape.direction == -1
 
-    def test_direction_rejects_invalid_values(self):
+    @pytest.mark.parametrize("bad", [0, 2])
+    def test_direction_rejects_invalid_values(self, bad):
         """direction should reject values other than 1 or -1."""
         shape = Shape()
-        with pytest.raises(ValueError, match="must be one of"):
-            shape.direction = 0
-        with pytest.raises(ValueError, match="must be one of"):
-            shape.direction = 2
+        with pytest.raises(ValueError, match=_MUST_BE_ONE_OF):
+            shape.direction = bad
 
-    def test_direction_rejects_invalid_types(self):
+    @pytest.mark.parametrize("bad", [1.0, "1"])
+    def test_direction_rejects_invalid_types(self, bad):
         """direction should reject non-integer types."""
         shape = Shape()
-        with pytest.raises(ValueError, match="must be int"):
-            shape.direction = 1.0
-        with pytest.raises(ValueError, match="must be int"):
-            shape.direction = "1"
+        with pytest.raises(ValueError, match=_MUST_BE_INT):
+            shape.direction = bad
 
 
 class TestLayerValidation:
@@ -305,13 +302,12 @@ class TestLayerValidation:
         layer.width = 0
         assert layer.width == 0
 
-    def test_width_rejects_invalid_types(self):
+    @pytest.mark.parametrize("bad", [600.5, "600"])
+    def test_width_rejects_invalid_types(self, bad):
         """width should reject non-integer types including floats."""
         layer = Layer()
-        with pytest.raises(ValueError, match="must be int"):
-            layer.width = 600.5
-        with pytest.raises(ValueError, match="must be int"):
-            layer.width = "600"
+        with pytest.raises(ValueError, match=_MUST_BE_INT):
+            layer.width = bad
 
     def test_height_accepts_valid_int(self):
         """height should accept integer values."""
@@ -321,13 +317,12 @@ class TestLayerValidation:
         layer.height = 0
         assert layer.height == 0
 
-    def test_height_rejects_invalid_types(self):
+    @pytest.mark.parametrize("bad", [800.5, "800"])
+    def test_height_rejects_invalid_types(self, bad):
         """height should reject non-integer types including floats."""
         layer = Layer()
-        with pytest.raises(ValueError, match="must be int"):
-            layer.height = 800.5
-        with pytest.raises(ValueError, match="must be int"):
-            layer.height = "800"
+        with pytest.raises(ValueError, match=_MUST_BE_INT):
+            layer.height = bad
 
     def test_vertWidth_accepts_valid_int(self):
         """vertWidth should accept integer values and None."""
@@ -337,13 +332,12 @@ class TestLayerValidation:
         layer.vertWidth = None
         assert layer.vertWidth is None
 
-    def test_vertWidth_rejects_invalid_types(self):
+    @pytest.mark.parametrize("bad", [1000.5, "1000"])
+    def test_vertWidth_rejects_invalid_types(self, bad):
         """vertWidth should reject non-integer types (except None)."""
         layer = Layer()
-        with pytest.raises(ValueError, match="must be int"):
-            layer.vertWidth = 1000.5
-        with pytest.raises(ValueError, match="must be int"):
-            layer.vertWidth = "1000"
+        with pytest.raises(ValueError, match=_MUST_BE_INT):
+            layer.vertWidth = bad
 
     def test_name_accepts_valid_string(self):
         """name should accept string values and None."""
@@ -353,10 +347,9 @@ class TestLayerValidation:
         layer.name = None
         assert layer.name is None
 
-    def test_name_rejects_invalid_types(self):
+    @pytest.mark.parametrize("bad", [123, []])
+    def test_name_rejects_invalid_types(self, bad):
         """name should reject non-string types (except None)."""
         layer = Layer()
-        with pytest.raises(ValueError, match="must be str"):
-            layer.name = 123
-        with pytest.raises(ValueError, match="must be str"):
-            layer.name = []
+        with pytest.raises(ValueError, match=_MUST_BE_STR):
+            layer.name = bad
@@ -232,6 +232,31 @@ def test_nested_new_objects_mark_owner_dirty():
     assert layer.is_dirty(DIRTY_FILE_SAVING)
 
 
+def test_extend_shapes_tracks_whole_batch():
+    """Extending a layer's shapes parents and tracks every new shape."""
+    font = Font()
+    font.initialize_dirty_tracking()
+
+    glyph = Glyph(name="A")
+    font.glyphs.append(glyph)
+
+    layer = Layer(name="Regular", _master="master-regular")
+    glyph.layers.append(layer)
+    layer.mark_clean(DIRTY_FILE_SAVING)
+
+    # Extend from a generator to make sure it is only consumed once
+    new_shapes = [Shape(ref="B"), Shape(ref="C"), Shape(ref="D")]
+    layer.shapes.extend(shape for shape in new_shapes)
+
+    assert len(layer.shapes) == 3
+    assert [s["ref"] for s in layer._data["shapes"]] == ["B", "C", "D"]
+    for shape in new_shapes:
+        assert shape._tracking_enabled
+        assert shape._dirty_flags is not None
+        assert shape._get_parent() == layer
+    assert layer.is_dirty(DIRTY_FILE_SAVING)
+
+
 def test_new_object_without_tracking_doesnt_break():
     """Creating objects on a font without tracking should not break."""
     font = Font()
@@ -4,9 +4,13 @@ This ensures that all object types serialize and deserialize correctly,
 including field aliases, format-specific data, and complex hierarchies.
 """
 
+import filecmp
+import functools
 import pytest
 import json
+import orjson
 from datetime import datetime
+from operator import attrgetter
 from context import load
 from context.Font import Font
 from context.Glyph import Glyph
@@ -21,14 +25,46 @@ from context.Axis import Axis
 from context.Instance import Instance
 from context.Features import Features
 
+_FEA_SRC = """
+@lowercase = [a b c d e];
+@uppercase = [A B C D E];
+
+# Prefix: kern
+lookup kern1 {
+    pos A V -50;
+    pos T a -30;
+} kern1;
+
+feature kern {
+    lookup kern1;
+} kern;
+
+feature liga {
+    sub f f i by f_f_i;
+    sub f f by f_f;
+} liga;
+"""
 
-@pytest.fixture
-def comprehensive_font(tmp_path):
-    """Create a comprehensive test font with all object types."""
+_DATE = datetime(2025, 11, 2, 12, 0, 0)
+
+
+@functools.lru_cache(maxsize=1)
+def _parsed_features():
+    """Parse the shared feature code once; callers must copy the result."""
+    return Features.from_fea(_FEA_SRC)
+
+
+@pytest.fixture(scope="module")
+def comprehensive_font():
+    """Create a comprehensive test font with all object types.
+
+    Built once per module: the tests below only save the font and
+    inspect what they load back, so they can share a single instance.
+    """
     font = Font()
     font.upm = 1000
     font.version = [2, 5]
-    font.date = datetime.strptime("2025-11-02 12:00:00", "%Y-%m-%d %H:%M:%S")
+    font.date = _DATE
     font.note = "Test font for roundtrip testing"
 
     # Set names with I18N
@@ -49,10 +85,8 @@ def comprehensive_font(tmp_path):
         default=400,
         _={"com.test": "weight-data"},
     )
-    font.axes.append(axis_weight)
-
     axis_width = Axis(name="Width", tag="wdth", min=75, max=125, default=100)
-    font.axes.append(axis_width)
+    font.axes.extend([axis_weight, axis_width])
 
     # Add instances
     instance_light = Instance(
@@ -60,10 +94,8 @@ def comprehensive_font(tmp_path):
         location={"wght": 300, "wdth": 100},
         _={"com.test": "instance-metadata"},
     )
-    font.instances.append(instance_light)
-
     instance_bold = Instance(name={"en": "Bold"}, location={"wght": 700, "wdth": 100})
-    font.instances.append(instance_bold)
+    font.instances.extend([instance_light, instance_bold])
 
     # Add masters
     master_regular = Master(
@@ -87,37 +119,15 @@ def comprehensive_font(tmp_path):
         ],
         _={"com.test": {"master": "data"}},
     )
-    font.masters.append(master_regular)
-
     master_bold = Master(
         name={"en": "Bold"},
         id="master-bold",
         location={"wght": 700, "wdth": 100},
     )
-    font.masters.append(master_bold)
-
-    # Add features
-    font.features = Features.from_fea(
-        """
-@lowercase = [a b c d e];
-@uppercase = [A B C D E];
-
-# Prefix: kern
-lookup kern1 {
-    pos A V -50;
-    pos T a -30;
-} kern1;
+    font.masters.extend([master_regular, master_bold])
 
-feature kern {
-    lookup kern1;
-} kern;
-
-feature liga {
-    sub f f i by f_f_i;
-    sub f f by f_f;
-} liga;
-"""
-    )
+    # Add features (copied from the once-parsed module-level source)
+    font.features = Features.from_dict(_parsed_features().to_dict())
     font.features._set_parent(font)
 
     # Create glyph with paths and nodes (including format-specific data)
@@ -146,44 +156,39 @@ feature liga {
     )
 
     # Add shape with nodes including format-specific data
-    shape_outline = Shape(
-        nodes=[
-            Node(100, 0, "line"),
-            Node(200, 0, "line", _={"com.test": "node-data"}),
-            Node(300, 700, "line"),
-            Node(250, 700, "curve"),
-            Node(200, 680, "offcurve"),
-            Node(150, 700, "curve"),
+    shape_outline = Shape.from_node_tuples(
+        [
+            (100, 0, "line"),
+            (200, 0, "line", {"com.test": "node-data"}),
+            (300, 700, "line"),
+            (250, 700, "curve"),
+            (200, 680, "offcurve"),
+            (150, 700, "curve"),
         ],
         closed=True,
         _={"com.test": "shape-metadata"},
     )
-    layer_a_regular.shapes.append(shape_outline)
 
     # Add second shape (counter)
-    shape_counter = Shape(
-        nodes=[
-            Node(150, 100, "line"),
-            Node(250, 100, "line"),
-            Node(220, 600, "line"),
-            Node(180, 600, "line"),
+    shape_counter = Shape.from_node_tuples(
+        [
+            (150, 100, "line"),
+            (250, 100, "line"),
+            (220, 600, "line"),
+            (180, 600, "line"),
         ],
         closed=True,
     )
-    layer_a_regular.shapes.append(shape_counter)
+    layer_a_regular.shapes.extend([shape_outline, shape_counter])
 
     # Add anchors
     anchor_top = Anchor(name="top", x=200, y=700, _={"com.test": "anchor-data"})
-    layer_a_regular.anchors.append(anchor_top)
-
     anchor_bottom = Anchor(name="bottom", x=200, y=0)
-    layer_a_regular.anchors.append(anchor_bottom)
-
-    glyph_a.layers.append(layer_a_regular)
+    layer_a_regular.anchors.extend([anchor_top, anchor_bottom])
 
     # Add bold layer
     layer_a_bold = Layer(width=650, height=0, _master="master-bold")
-    glyph_a.layers.append(layer_a_bold)
+    glyph_a.layers.extend([layer_a_regular, layer_a_bold])
 
     font.glyphs.append(glyph_a)
 
@@ -200,11 +205,10 @@ feature liga {
         transform=[1, 0, 0, 1, 0, 0],
         _={"com.test": "component-data"},
     )
-    layer_aacute.shapes.append(component_a)
 
     # Add component for accent
     component_acute = Shape(ref="acutecomb", transform=[1, 0, 0, 1, 200, 700])
-    layer_aacute.shapes.append(component_acute)
+    layer_aacute.shapes.extend([component_a, component_acute])
 
     glyph_aacute.layers.append(layer_aacute)
     font.glyphs.append(glyph_aacute)
@@ -216,12 +220,8 @@ feature liga {
 
     layer_acute = Layer(width=0, height=0, _master="master-regular")
 
-    shape_acute = Shape(
-        nodes=[
-            Node(0, 0, "line"),
-            Node(100, 100, "line"),
-            Node(50, 100, "line"),
-        ],
+    shape_acute = Shape.from_node_tuples(
+        [(0, 0, "line"), (100, 100, "line"), (50, 100, "line")],
         closed=True,
     )
     layer_acute.shapes.append(shape_acute)
@@ -235,23 +235,138 @@ feature liga {
     return font
 
 
+@pytest.fixture(scope="module")
+def saved_font(comprehensive_font, tmp_path_factory):
+    """Save comprehensive_font once and load it back.
+
+    Returns the path it was saved to and the loaded font. The saved copy
+    doubles as a snapshot: tests that need a font they can modify load
+    their own from the path instead of saving the original again.
+    """
+    font_path = tmp_path_factory.mktemp("roundtrip") / "saved.babelfont"
+    comprehensive_font.save(str(font_path))
+    return font_path, load(str(font_path))
+
+
+def _canonical(font):
+    """Serialize a font to a canonical JSON string for fast equality checks.
+
+    Mirrors the normalizations compare_fonts() applies: the filename the
+    font was loaded from is ignored, and single-value I18N names compare
+    by their value only.
+    """
+    data = font.to_dict()
+    data.pop("filename", None)
+    data["names"] = {
+        key: (
+            next(iter(value.values()))
+            if isinstance(value, dict) and len(value) == 1
+            else value
+        )
+        for key, value in data["names"].items()
+    }
+    return json.dumps(data, sort_keys=True, default=str)
+
+
+# Attributes compared for each object type, read in one attrgetter call
+_COMPARED_FIELDS = {
+    Axis: ("name", "tag", "min", "max", "default"),
+    Instance: ("name", "location"),
+    Master: ("name", "id", "location", "kerning"),
+    Guide: ("name", "position", "color"),
+    Glyph: ("name", "category", "codepoints", "exported"),
+    Layer: ("width", "height", "_master"),
+    Shape: ("ref", "transform", "closed"),
+    Node: ("x", "y", "type"),
+    Anchor: ("name", "x", "y"),
+}
+_COMPARED_KEYS = {cls: attrgetter(*fields) for cls, fields in _COMPARED_FIELDS.items()}
+
+
+def _compare_fields(obj1, obj2, path, differences):
+    """Compare several attributes at once, itemizing them only on mismatch."""
+    keys = _COMPARED_KEYS[type(obj1)]
+    if keys(obj1) == keys(obj2):
+        return
+    for attr in _COMPARED_FIELDS[type(obj1)]:
+        val1 = getattr(obj1, attr)
+        val2 = getattr(obj2, attr)
+        if val1 != val2:
+            differences.append((f"{path}.{attr}", val1, val2))
+
+
+def _compare_list(list1, list2, path, differences, recurse=None):
+    """Compare two lists of objects pairwise.
+
+    Each pair is compared by its fields and user data, then passed to
+    ``recurse`` (if given) to compare its children.
+    """
+    if len(list1) != len(list2):
+        differences.append((f"{path} length", len(list1), len(list2)))
+    for i, (obj1, obj2) in enumerate(zip(list1, list2)):
+        if obj1 is obj2:
+            continue
+        item_path = f"{path}[{i}]"
+        _compare_fields(obj1, obj2, item_path, differences)
+        if obj1.user_data != obj2.user_data:
+            differences.append(
+                (f"{item_path}.user_data", obj1.user_data, obj2.user_data)
+            )
+        if recurse is not None:
+            recurse(obj1, obj2, item_path, differences)
+
+
+def _compare_master(master1, master2, path, differences):
+    _compare_list(master1.guides, master2.guides, f"{path}.guides", differences)
+
+
+def _compare_glyph(glyph1, glyph2, path, differences):
+    _compare_list(
+        glyph1.layers, glyph2.layers, f"{path}.layers", differences, _compare_layer
+    )
+
+
+def _compare_layer(layer1, layer2, path, differences):
+    _compare_list(layer1.guides, layer2.guides, f"{path}.guides", differences)
+    _compare_list(
+        layer1.shapes, layer2.shapes, f"{path}.shapes", differences, _compare_shape
+    )
+    _compare_list(layer1.anchors, layer2.anchors, f"{path}.anchors", differences)
+
+
+def _compare_shape(shape1, shape2, path, differences):
+    # Components have no nodes
+    if shape1.nodes and shape2.nodes:
+        _compare_list(shape1.nodes, shape2.nodes, f"{path}.nodes", differences)
+
+
+def _format(differences):
+    """Turn (path, value1, value2) difference tuples into messages."""
+    return [f"{path}: {val1!r} != {val2!r}" for path, val1, val2 in differences]
+
+
 def compare_fonts(font1, font2, path="font"):
     """Recursively compare two font objects for equality.
 
-    Returns a list of differences found.
+    Returns a list of differences found. Objects that are the same
+    instance on both sides are skipped without walking them.
     """
+    # Differences are collected as (path, value1, value2) tuples and only
+    # formatted into messages at the end, if there are any
     differences = []
+    if font1 is font2:
+        return differences
 
     # Compare basic attributes
     for attr in ["upm", "version", "note"]:
         val1 = getattr(font1, attr, None)
         val2 = getattr(font2, attr, None)
         if val1 != val2:
-            differences.append(f"{path}.{attr}: {val1} != {val2}")
+            differences.append((f"{path}.{attr}", val1, val2))
 
     # Compare dates (convert to string for comparison)
     if str(font1.date) != str(font2.date):
-        differences.append(f"{path}.date: {font1.date} != {font2.date}")
+        differences.append((f"{path}.date", font1.date, font2.date))
 
     # Compare names (normalize I18N dicts for comparison)
     for name_field in ["familyName", "styleName", "designer", "manufacturerURL"]:
@@ -263,254 +378,47 @@ def compare_fonts(font1, font2, path="font"):
         if hasattr(val2, "get_default") and len(val2) == 1:
             val2 = val2.get_default()
         if val1 != val2:
-            differences.append(f"{path}.names.{name_field}: {val1} != {val2}")
+            differences.append((f"{path}.names.{name_field}", val1, val2))
 
     # Compare format-specific
     if font1.user_data != font2.user_data:
-        differences.append(
-            f"{path}.user_data: " f"{font1.user_data} != {font2.user_data}"
-        )
-
-    # Compare axes
-    if len(font1.axes) != len(font2.axes):
-        differences.append(
-            f"{path}.axes length: {len(font1.axes)} != {len(font2.axes)}"
-        )
-    for i, (axis1, axis2) in enumerate(zip(font1.axes, font2.axes)):
-        for attr in ["name", "tag", "min", "max", "default"]:
-            val1 = getattr(axis1, attr)
-            val2 = getattr(axis2, attr)
-            if val1 != val2:
-                differences.append(f"{path}.axes[{i}].{attr}: {val1} != {val2}")
-        if axis1.user_data != axis2.user_data:
-            differences.append(
-                f"{path}.axes[{i}].user_data: "
-                f"{axis1.user_data} != {axis2.user_data}"
-            )
+        differences.append((f"{path}.user_data", font1.user_data, font2.user_data))
 
-    # Compare instances
-    if len(font1.instances) != len(font2.instances):
-        differences.append(
-            f"{path}.instances length: "
-            f"{len(font1.instances)} != {len(font2.instances)}"
-        )
-    for i, (inst1, inst2) in enumerate(zip(font1.instances, font2.instances)):
-        if inst1.name != inst2.name:
-            differences.append(
-                f"{path}.instances[{i}].name: {inst1.name} != {inst2.name}"
-            )
-        if inst1.location != inst2.location:
-            differences.append(
-                f"{path}.instances[{i}].location: "
-                f"{inst1.location} != {inst2.location}"
-            )
-        if inst1.user_data != inst2.user_data:
-            differences.append(
-                f"{path}.instances[{i}].user_data: "
-                f"{inst1.user_data} != {inst2.user_data}"
-            )
-
-    # Compare masters
-    if len(font1.masters) != len(font2.masters):
-        differences.append(
-            f"{path}.masters length: " f"{len(font1.masters)} != {len(font2.masters)}"
-        )
-    for i, (master1, master2) in enumerate(zip(font1.masters, font2.masters)):
-        for attr in ["name", "id", "location", "kerning"]:
-            val1 = getattr(master1, attr)
-            val2 = getattr(master2, attr)
-            if val1 != val2:
-                differences.append(f"{path}.masters[{i}].{attr}: {val1} != {val2}")
-        if master1.user_data != master2.user_data:
-            differences.append(
-                f"{path}.masters[{i}].user_data: "
-                f"{master1.user_data} != {master2.user_data}"
-            )
-
-        # Compare master guides
-        if len(master1.guides) != len(master2.guides):
-            differences.append(
-                f"{path}.masters[{i}].guides length: "
-                f"{len(master1.guides)} != {len(master2.guides)}"
-            )
-        for j, (guide1, guide2) in enumerate(zip(master1.guides, master2.guides)):
-            if guide1.name != guide2.name:
-                differences.append(
-                    f"{path}.masters[{i}].guides[{j}].name: "
-                    f"{guide1.name} != {guide2.name}"
-                )
-            if guide1.position != guide2.position:
-                differences.append(
-                    f"{path}.masters[{i}].guides[{j}].position: "
-                    f"{guide1.position} != {guide2.position}"
-                )
-            if guide1.color != guide2.color:
-                differences.append(
-                    f"{path}.masters[{i}].guides[{j}].color: "
-                    f"{guide1.color} != {guide2.color}"
-                )
+    _compare_list(font1.axes, font2.axes, f"{path}.axes", differences)
+    _compare_list(font1.instances, font2.instances, f"{path}.instances", differences)
+    _compare_list(
+        font1.masters, font2.masters, f"{path}.masters", differences, _compare_master
+    )
 
     # Compare features
     if font1.features and font2.features:
-        if font1.features.classes != font2.features.classes:
-            differences.append(
-                f"{path}.features.classes: "
-                f"{font1.features.classes} != {font2.features.classes}"
-            )
-        if font1.features.prefixes != font2.features.prefixes:
-            differences.append(
-                f"{path}.features.prefixes: "
-                f"{font1.features.prefixes} != {font2.features.prefixes}"
-            )
-        if font1.features.features != font2.features.features:
-            differences.append(
-                f"{path}.features.features: "
-                f"{font1.features.features} != {font2.features.features}"
-            )
+        for attr in ["classes", "prefixes", "features"]:
+            val1 = getattr(font1.features, attr)
+            val2 = getattr(font2.features, attr)
+            if val1 != val2:
+                differences.append((f"{path}.features.{attr}", val1, val2))
     elif font1.features or font2.features:
-        differences.append(f"{path}.features: one has features, other doesn't")
-
-    # Compare glyphs
-    if len(font1.glyphs) != len(font2.glyphs):
         differences.append(
-            f"{path}.glyphs length: " f"{len(font1.glyphs)} != {len(font2.glyphs)}"
+            (f"{path}.features present", bool(font1.features), bool(font2.features))
         )
 
-    for i, (glyph1, glyph2) in enumerate(zip(font1.glyphs, font2.glyphs)):
-        gpath = f"{path}.glyphs[{i}]"
-        for attr in ["name", "category", "codepoints", "exported"]:
-            val1 = getattr(glyph1, attr)
-            val2 = getattr(glyph2, attr)
-            if val1 != val2:
-                differences.append(f"{gpath}.{attr}: {val1} != {val2}")
+    _compare_list(
+        font1.glyphs, font2.glyphs, f"{path}.glyphs", differences, _compare_glyph
+    )
 
-        if glyph1.user_data != glyph2.user_data:
-            differences.append(
-                f"{gpath}.user_data: " f"{glyph1.user_data} != {glyph2.user_data}"
-            )
+    return _format(differences)
 
-        # Compare layers
-        if len(glyph1.layers) != len(glyph2.layers):
-            differences.append(
-                f"{gpath}.layers length: "
-                f"{len(glyph1.layers)} != {len(glyph2.layers)}"
-            )
 
-        for j, (layer1, layer2) in enumerate(zip(glyph1.layers, glyph2.layers)):
-            lpath = f"{gpath}.layers[{j}]"
-            for attr in ["width", "height", "_master"]:
-                val1 = getattr(layer1, attr)
-                val2 = getattr(layer2, attr)
-                if val1 != val2:
-                    differences.append(f"{lpath}.{attr}: {val1} != {val2}")
-
-            if layer1.user_data != layer2.user_data:
-                differences.append(
-                    f"{lpath}.user_data: " f"{layer1.user_data} != {layer2.user_data}"
-                )
-
-            # Compare guides
-            if len(layer1.guides) != len(layer2.guides):
-                differences.append(
-                    f"{lpath}.guides length: "
-                    f"{len(layer1.guides)} != {len(layer2.guides)}"
-                )
-            for k, (guide1, guide2) in enumerate(zip(layer1.guides, layer2.guides)):
-                if guide1.name != guide2.name:
-                    differences.append(
-                        f"{lpath}.guides[{k}].name: " f"{guide1.name} != {guide2.name}"
-                    )
-                if guide1.position != guide2.position:
-                    differences.append(
-                        f"{lpath}.guides[{k}].position: "
-                        f"{guide1.position} != {guide2.position}"
-                    )
-                if guide1.color != guide2.color:
-                    differences.append(
-                        f"{lpath}.guides[{k}].color: "
-                        f"{guide1.color} != {guide2.color}"
-                    )
-
-            # Compare shapes
-            if len(layer1.shapes) != len(layer2.shapes):
-                differences.append(
-                    f"{lpath}.shapes length: "
-                    f"{len(layer1.shapes)} != {len(layer2.shapes)}"
-                )
-
-            for k, (shape1, shape2) in enumerate(zip(layer1.shapes, layer2.shapes)):
-                spath = f"{lpath}.shapes[{k}]"
-                for attr in ["ref", "transform", "closed"]:
-                    val1 = getattr(shape1, attr, None)
-                    val2 = getattr(shape2, attr, None)
-                    if val1 != val2:
-                        differences.append(f"{spath}.{attr}: {val1} != {val2}")
-
-                if shape1.user_data != shape2.user_data:
-                    differences.append(
-                        f"{spath}.user_data: "
-                        f"{shape1.user_data} != "
-                        f"{shape2.user_data}"
-                    )
-
-                # Compare nodes
-                if shape1.nodes and shape2.nodes:
-                    if len(shape1.nodes) != len(shape2.nodes):
-                        differences.append(
-                            f"{spath}.nodes length: "
-                            f"{len(shape1.nodes)} != {len(shape2.nodes)}"
-                        )
-
-                    for m, (node1, node2) in enumerate(zip(shape1.nodes, shape2.nodes)):
-                        npath = f"{spath}.nodes[{m}]"
-                        for attr in ["x", "y", "type"]:
-                            val1 = getattr(node1, attr)
-                            val2 = getattr(node2, attr)
-                            if val1 != val2:
-                                differences.append(f"{npath}.{attr}: {val1} != {val2}")
-                        if node1.user_data != node2.user_data:
-                            differences.append(
-                                f"{npath}.user_data: "
-                                f"{node1.user_data} != "
-                                f"{node2.user_data}"
-                            )
-
-            # Compare anchors
-            if len(layer1.anchors) != len(layer2.anchors):
-                differences.append(
-                    f"{lpath}.anchors length: "
-                    f"{len(layer1.anchors)} != {len(layer2.anchors)}"
-                )
-
-            for k, (anchor1, anchor2) in enumerate(zip(layer1.anchors, layer2.anchors)):
-                apath = f"{lpath}.anchors[{k}]"
-                for attr in ["name", "x", "y"]:
-                    val1 = getattr(anchor1, attr)
-                    val2 = getattr(anchor2, attr)
-                    if val1 != val2:
-                        differences.append(f"{apath}.{attr}: {val1} != {val2}")
-                if anchor1.user_data != anchor2.user_data:
-                    differences.append(
-                        f"{apath}.user_data: "
-                        f"{anchor1.user_data} != "
-                        f"{anchor2.user_data}"
-                    )
-
-    return differences
-
-
-def test_complete_roundtrip(comprehensive_font, tmp_path):
+def test_complete_roundtrip(saved_font, tmp_path):
     """Test that a font survives multiple save/load cycles unchanged.
 
     Note: The first save/load may normalize some values (e.g., I18N dicts
     with single values become plain strings then {"dflt": value}), but
     subsequent cycles should be stable.
     """
-    # Save the original font
-    path1 = tmp_path / "roundtrip1.babelfont"
-    comprehensive_font.save(str(path1))
-
-    # Load it back
+    # Start from the shared on-disk copy of the original font, loaded
+    # afresh since this font is saved again below
+    path1, _ = saved_font
     font2 = load(str(path1))
 
     # Save it again
@@ -529,37 +437,34 @@ def test_complete_roundtrip(comprehensive_font, tmp_path):
 
     # The key test: second and third reloads should be identical
     # (format has stabilized after first normalization)
-    diffs_2_3 = compare_fonts(font2, font3, "reload1 vs reload2")
-    diffs_3_4 = compare_fonts(font3, font4, "reload2 vs reload3")
-
-    if diffs_2_3:
-        print("\nDifferences between reload1 and reload2:")
-        for diff in diffs_2_3:
-            print(f"  {diff}")
-
-    if diffs_3_4:
-        print("\nDifferences between reload2 and reload3:")
-        for diff in diffs_3_4:
-            print(f"  {diff}")
-
-    # After first normalization, subsequent cycles should be stable
-    assert not diffs_2_3, "Font changed between reload1 and reload2"
-    assert not diffs_3_4, "Font changed between reload2 and reload3"
-
-
-def test_field_aliases_in_files(comprehensive_font, tmp_path):
+    canonical2, canonical3, canonical4 = map(_canonical, (font2, font3, font4))
+    try:
+        assert canonical2 == canonical3, "Font changed between reload1 and reload2"
+        assert canonical3 == canonical4, "Font changed between reload2 and reload3"
+    except AssertionError:
+        # Only walk the object trees to explain a mismatch
+        for label, (a, b) in {
+            "reload1 vs reload2": (font2, font3),
+            "reload2 vs reload3": (font3, font4),
+        }.items():
+            diffs = compare_fonts(a, b, label)
+            if diffs:
+                print(f"\nDifferences between {label}:")
+                for diff in diffs:
+                    print(f"  {diff}")
+        raise
+
+
+def test_field_aliases_in_files(saved_font):
     """Verify that field aliases work correctly in saved files.
 
     The file format should use 'pos' while Python API uses 'position'.
     """
-    # Save the font
-    font_path = tmp_path / "alias_test.babelfont"
-    comprehensive_font.save(str(font_path))
+    font_path, font_loaded = saved_font
 
     # Check that master guides use 'pos' in the file
     info_file = font_path / "info.json"
-    with open(info_file, "r") as f:
-        info_data = json.load(f)
+    info_data = orjson.loads(info_file.read_bytes())
 
     master_data = info_data["masters"][0]
     if master_data.get("guides"):
@@ -571,8 +476,7 @@ def test_field_aliases_in_files(comprehensive_font, tmp_path):
 
     # Check that layer guides use 'pos' in the file
     glyph_file = font_path / "glyphs" / "A_.nfsglyph"
-    with open(glyph_file, "r") as f:
-        layers_data = json.load(f)
+    layers_data = orjson.loads(glyph_file.read_bytes())
 
     layer_data = layers_data[0]
     if layer_data.get("guides"):
@@ -583,18 +487,14 @@ def test_field_aliases_in_files(comprehensive_font, tmp_path):
         ), "Layer guides should not use 'position' in file"
 
     # Verify that loading back works with Python API
-    font_loaded = load(str(font_path))
     master = font_loaded.masters[0]
     assert hasattr(master.guides[0], "position"), "Should have 'position' attr"
     assert master.guides[0].position.x == 0, "Position should have correct value"
 
 
-def testuser_data_roundtrip(comprehensive_font, tmp_path):
+def testuser_data_roundtrip(comprehensive_font, saved_font):
     """Verify that user_data data survives roundtrips on all objects."""
-    # Save and reload
-    font_path = tmp_path / "formatspecific_test.babelfont"
-    comprehensive_font.save(str(font_path))
-    font_loaded = load(str(font_path))
+    _, font_loaded = saved_font
 
     # Check font level
     assert font_loaded.user_data == comprehensive_font.user_data
@@ -669,8 +569,7 @@ def test_node_serialization_formats(tmp_path):
 
     # Check file format
     glyph_file = font_path / "glyphs" / "test.nfsglyph"
-    with open(glyph_file, "r") as f:
-        layers_data = json.load(f)
+    layers_data = orjson.loads(glyph_file.read_bytes())
 
     nodes_data = layers_data[0]["shapes"][0]["nodes"]
     assert len(nodes_data[0]) == 3, "Node without formatspecific should be 3-element"
@@ -687,7 +586,7 @@ def test_node_serialization_formats(tmp_path):
     assert nodes_loaded[2].user_data == {}
 
 
-def test_save_without_tracking_identical(comprehensive_font, tmp_path):
+def test_save_without_tracking_identical(saved_font, tmp_path):
     """Test that saving produces identical results with or without tracking.
 
     This ensures that initialize_dirty_tracking() doesn't affect serialization.
@@ -698,9 +597,9 @@ def test_save_without_tracking_identical(comprehensive_font, tmp_path):
     import context
     from context import Font
 
-    # First: Save the comprehensive font (which has tracking enabled)
-    path_original = tmp_path / "original.babelfont"
-    comprehensive_font.save(str(path_original))
+    # First: Use the comprehensive font as saved once for this module
+    # (it had tracking enabled)
+    path_original, _ = saved_font
 
     # Second: Load it WITH tracking (explicitly initialize)
     font_with_tracking = load(str(path_original))
@@ -719,49 +618,47 @@ def test_save_without_tracking_identical(comprehensive_font, tmp_path):
     # Fourth: Compare the saved files - they should be identical
     import os
 
-    # Compare info.json files
-    with open(path_with_tracking / "info.json") as f:
-        data_with = json.load(f)
-    with open(path_no_tracking / "info.json") as f:
-        data_without = json.load(f)
-
-    assert (
-        data_with == data_without
-    ), "info.json should be identical with/without tracking"
-
-    # Compare names.json files
-    with open(path_with_tracking / "names.json") as f:
-        names_with = json.load(f)
-    with open(path_no_tracking / "names.json") as f:
-        names_without = json.load(f)
-
-    assert names_with == names_without, "names.json should be identical"
+    # Compare info.json and names.json files. Byte-identical files need
+    # no parsing; only fall back to comparing the decoded JSON on mismatch
+    for json_name in ["info.json", "names.json"]:
+        file_with = path_with_tracking / json_name
+        file_without = path_no_tracking / json_name
+        if not filecmp.cmp(file_with, file_without, shallow=False):
+            assert orjson.loads(file_with.read_bytes()) == orjson.loads(
+                file_without.read_bytes()
+            ), f"{json_name} should be identical with/without tracking"
 
     # Compare features.fea if present
     features_with = path_with_tracking / "features.fea"
     features_without = path_no_tracking / "features.fea"
     if features_with.exists() and features_without.exists():
-        assert (
-            features_with.read_text() == features_without.read_text()
+        assert filecmp.cmp(
+            features_with, features_without, shallow=False
         ), "features.fea should be identical"
 
     # Compare glyph files
     glyphs_dir_with = path_with_tracking / "glyphs"
     glyphs_dir_without = path_no_tracking / "glyphs"
 
-    glyph_files_with = sorted(os.listdir(glyphs_dir_with))
-    glyph_files_without = sorted(os.listdir(glyphs_dir_without))
+    # Listing order doesn't matter, so compare the names as sets
+    glyph_files_with = set(os.listdir(glyphs_dir_with))
+    glyph_files_without = set(os.listdir(glyphs_dir_without))
 
     assert (
         glyph_files_with == glyph_files_without
     ), "Should have same glyph files with/without tracking"
 
-    # Compare each glyph file
-    for glyph_file in glyph_files_with:
-        with open(glyphs_dir_with / glyph_file) as f:
-            glyph_data_with = json.load(f)
-        with open(glyphs_dir_without / glyph_file) as f:
-            glyph_data_without = json.load(f)
+    # Byte-compare all glyph files in one pass, then decode only the
+    # mismatches to check whether they still hold the same data
+    _, mismatch, errors = filecmp.cmpfiles(
+        glyphs_dir_with, glyphs_dir_without, glyph_files_with, shallow=False
+    )
+    assert not errors, f"Could not compare glyph files: {errors}"
+    for glyph_file in mismatch:
+        glyph_data_with = orjson.loads((glyphs_dir_with / glyph_file).read_bytes())
+        glyph_data_without = orjson.loads(
+            (glyphs_dir_without / glyph_file).read_bytes()
+        )
 
         assert (
             glyph_data_with == glyph_data_without
@@ -36,6 +36,13 @@ class TestBaseObjectRoundTrip:
         node2_dict = node2.to_dict()
         assert node_dict == node2_dict
 
+    def test_node_type_is_interned(self):
+        """Test node types parsed from lists share one string object."""
+        node = Node.from_dict([100, 200, "".join(["l", "s"])])
+        node2 = Node.from_dict([0, 0, "".join(["l", "s"])])
+
+        assert node.type is node2.type
+
     def test_anchor_round_trip(self):
         """Test Anchor to_dict/from_dict round-trip."""
         anchor = Anchor(name="top", x=250, y=700)
@@ -64,6 +71,21 @@ class TestBaseObjectRoundTrip:
         guide2_dict = guide2.to_dict()
         assert guide_dict == guide2_dict
 
+    def test_guide_position_and_color_from_dicts(self):
+        """Test Guide reads partial dicts with defaults and rejects unknown keys."""
+        from context.BaseObject import Color, Position
+
+        guide = Guide(_data={"pos": {"x": 1, "y": 2}, "color": {"r": 255}})
+        assert guide.position == Position(1, 2, 0)
+        assert guide.color == Color(255, 0, 0, 0)
+
+        guide = Guide(_data={"pos": {"x": 1, "y": 2, "z": 3}})
+        with pytest.raises(TypeError):
+            guide.position
+        guide = Guide(_data={"color": {"r": 1, "g": 2, "b": 3, "alpha": 4}})
+        with pytest.raises(TypeError):
+            guide.color
+
 
 class TestShapeRoundTrip:
     """Test Shape round-tripping."""
@@ -91,6 +113,25 @@ class TestShapeRoundTrip:
         # Verify functional equivalence (objects work correctly)
         # Note: Exact dict equality may vary due to default value handling
 
+    def test_path_shape_from_node_tuples(self):
+        """Test building a path Shape from node tuples."""
+        shape = Shape.from_node_tuples(
+            [(10, 10, "line"), (100, 20, "line", {"com.test": "node-data"})],
+            closed=False,
+            _={"com.test": "shape-data"},
+        )
+        expected = Shape(
+            nodes=[
+                Node(x=10, y=10, type="line"),
+                Node(x=100, y=20, type="line", _={"com.test": "node-data"}),
+            ],
+            closed=False,
+            _={"com.test": "shape-data"},
+        )
+
+        assert shape.to_dict() == expected.to_dict()
+        assert all(node._get_parent() is shape for node in shape.nodes)
+
     def test_component_shape_round_trip(self):
         """Test Shape as component round-trip."""
         from fontTools.misc.transform import Transform
@@ -165,6 +206,12 @@ class TestNamesRoundTrip:
         names2_dict = names2.to_dict()
         assert names_dict == names2_dict
 
+    def test_i18n_get_default_falls_back_to_first_value(self):
+        """Test get_default() without a "dflt" entry."""
+        names = I18NDictionary({"de": "Schrift", "en": "Font"})
+        assert names.get_default() == "Schrift"
+        assert I18NDictionary().get_default() is None
+
 
 class TestMasterRoundTrip:
     """Test Master round-tripping."""
@@ -195,6 +242,24 @@ class TestMasterRoundTrip:
         assert "kerning" in master2_dict
         assert len(master2_dict["kerning"]) == 2
 
+    def test_master_get_kerning(self):
+        """Test single-pair kerning lookup for both key formats."""
+        master = Master(id="master01", name="Regular", kerning={("A", "V"): -50})
+        assert master.get_kerning("A", "V") == -50
+        assert master.get_kerning("V", "A") == 0
+
+        master.kerning = {("T", "o"): -30}
+        assert master.get_kerning("T", "o") == -30
+        assert master.get_kerning("A", "V", default=None) is None
+
+    def test_master_kerning_setter_uses_string_keys(self):
+        """Test kerning setter stores "left//right" keys in _data."""
+        master = Master(id="master01", name="Regular", location={"wght": 400})
+        master.kerning = {("A", "V"): -50, "T//o": -30}
+
+        assert master._data["kerning"] == {"A//V": -50, "T//o": -30}
+        assert master.kerning == {("A", "V"): -50, ("T", "o"): -30}
+
 
 class TestGlyphRoundTrip:
     """Test Glyph round-tripping."""
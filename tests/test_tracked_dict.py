@@ -1,9 +1,26 @@
 """Tests for TrackedDict wrapper that tracks dictionary modifications."""
 
+import pytest
+
 from context import Font, Glyph, Layer, Node
 from context.BaseObject import DIRTY_FILE_SAVING, DIRTY_CANVAS_RENDER
 
 
+@pytest.fixture
+def count_notifications():
+    """Return a function that records each mark_dirty() call on an object."""
+
+    def watch(obj):
+        calls = []
+        mark_dirty = obj.mark_dirty
+        obj.mark_dirty = lambda *args, **kwargs: calls.append(
+            mark_dirty(*args, **kwargs)
+        )
+        return calls
+
+    return watch
+
+
 def test_tracked_dict_setitem():
     """Test that setting dict items marks object dirty."""
     font = Font()
@@ -47,6 +64,120 @@ def test_tracked_dict_update():
     assert font.is_dirty(DIRTY_FILE_SAVING)
 
 
+def test_tracked_dict_update_notifies_once(count_notifications):
+    """Test that update() notifies the owner once, not once per key."""
+    font = Font()
+    font.initialize_dirty_tracking()
+    user_data = font.user_data
+    calls = count_notifications(font)
+
+    user_data.update({"com.test1": "value1", "com.test2": "value2"}, extra=3)
+
+    assert len(calls) == 1
+    assert dict(user_data) == {"com.test1": "value1", "com.test2": "value2", "extra": 3}
+
+
+def test_tracked_dict_empty_update_no_dirty(count_notifications):
+    """Test that update() and |= with nothing to merge don't notify."""
+    font = Font(_={"com.test": "value"})
+    font.initialize_dirty_tracking()
+    user_data = font.user_data
+    calls = count_notifications(font)
+
+    user_data.update()
+    user_data.update({})
+    user_data.update([])
+    user_data |= {}
+
+    assert calls == []
+    assert not font.is_dirty(DIRTY_FILE_SAVING)
+
+
+def test_tracked_dict_batch_notifies_once(count_notifications):
+    """Test that mutations inside batch() notify the owner once, on exit."""
+    font = Font()
+    font.initialize_dirty_tracking()
+    user_data = font.user_data
+    calls = count_notifications(font)
+
+    with user_data.batch():
+        for i in range(10000):
+            user_data[f"com.test{i}"] = i
+        with user_data.batch():
+            del user_data["com.test0"]
+        assert calls == []
+
+    assert len(calls) == 1
+    assert len(user_data) == 9999
+    assert font.is_dirty(DIRTY_FILE_SAVING)
+
+
+def test_tracked_dict_batch_exception_unmutes(count_notifications):
+    """Test that a batch() block that raises still flushes and resets."""
+    font = Font()
+    font.initialize_dirty_tracking()
+    user_data = font.user_data
+    calls = count_notifications(font)
+
+    with pytest.raises(RuntimeError):
+        with user_data.batch():
+            user_data["com.test"] = "value"
+            raise RuntimeError("boom")
+
+    # The pending change is flushed and the owner isn't left muted
+    assert len(calls) == 1
+    assert user_data._batch_depth == 0
+    user_data["com.other"] = "value"
+    assert len(calls) == 2
+
+
+def test_tracked_dict_setitem_same_value_no_dirty(count_notifications):
+    """Test that re-storing an equal scalar doesn't notify the owner."""
+    font = Font(
+        _={
+            "com.test": "value",
+            "com.count": 1,
+            "com.flag": True,
+            "com.nested": {"a": 1},
+        }
+    )
+    font.initialize_dirty_tracking()
+    user_data = font.user_data
+    calls = count_notifications(font)
+
+    user_data["com.test"] = "value"
+    user_data["com.count"] = 1
+    user_data["com.flag"] = True
+    assert calls == []
+
+    # Equal but of a different type is still a change
+    user_data["com.count"] = 1.0
+    assert len(calls) == 1
+    assert type(user_data["com.count"]) is float
+    user_data["com.flag"] = 1
+    assert len(calls) == 2
+    assert type(user_data["com.flag"]) is int
+
+    # Re-assigning a mutable value always notifies
+    user_data["com.nested"] = user_data["com.nested"]
+    assert len(calls) == 3
+
+
+def test_tracked_dict_setitem_signed_zero(count_notifications):
+    """Test that -0.0 replacing 0.0 (equal, same type) is still a change."""
+    font = Font(_={"com.offset": 0.0})
+    font.initialize_dirty_tracking()
+    user_data = font.user_data
+    calls = count_notifications(font)
+
+    user_data["com.offset"] = 0.0
+    assert calls == []
+
+    user_data["com.offset"] = -0.0
+    assert len(calls) == 1
+    assert str(user_data["com.offset"]) == "-0.0"
+
+
 def test_tracked_dict_clear():
     """Test that dict.clear() marks object dirty."""
     font = Font(_={"com.test": "value"})
@@ -75,6 +206,31 @@ def test_tracked_dict_pop():
     assert font.is_dirty(DIRTY_FILE_SAVING)
 
 
+def test_tracked_dict_pop_missing_key():
+    """Test that pop() of a missing key neither marks dirty nor hides errors."""
+    font = Font(_={"com.test": "value"})
+    font.initialize_dirty_tracking()
+    font.mark_clean(DIRTY_FILE_SAVING)
+
+    assert font.user_data.pop("com.missing", None) is None
+    assert not font.is_dirty(DIRTY_FILE_SAVING)
+    with pytest.raises(KeyError):
+        font.user_data.pop("com.missing")
+
+
+def test_tracked_dict_ior():
+    """Test that |= marks object dirty."""
+    font = Font()
+    font.initialize_dirty_tracking()
+    font.mark_clean(DIRTY_FILE_SAVING)
+
+    user_data = font.user_data
+    user_data |= {"com.test": "value"}
+
+    assert font.user_data["com.test"] == "value"
+    assert font.is_dirty(DIRTY_FILE_SAVING)
+
+
 def test_tracked_dict_setdefault():
     """Test that dict.setdefault() marks object dirty when setting."""
     font = Font()
@@ -139,24 +295,10 @@ def test_tracked_dict_on_different_objects():
     layer = Layer(_={"com.test": "layer"})
     node = Node(100, 200, "c", _={"com.test": "node"})
 
-    # Initialize tracking for all objects
-    from context.BaseObject import BaseObject
-
+    # Initialize tracking for all objects, converting user_data up front
     for obj in [glyph, layer, node]:
-        object.__setattr__(obj, "_tracking_enabled", True)
-        if obj._dirty_flags is None:
-            object.__setattr__(obj, "_dirty_flags", {})
-        if obj._dirty_fields is None:
-            object.__setattr__(obj, "_dirty_fields", {})
-        # Convert user_data to TrackedDict
-        from context.BaseObject import TrackedDict
-
-        if isinstance(obj.user_data, dict) and not isinstance(
-            obj.user_data, TrackedDict
-        ):
-            tracked = TrackedDict(owner=obj)
-            tracked.update(obj.user_data)
-            object.__setattr__(obj, "user_data", tracked)
+        obj._enable_tracking(wrap_user_data=True)
+        assert not obj.is_dirty(DIRTY_FILE_SAVING)
 
     from context.BaseObject import TrackedDict
 
@@ -198,6 +340,50 @@ def test_tracked_dict_preserves_dict_interface():
     assert keys == ["key1", "key2"]
 
 
+def test_tracked_dict_inherits_read_methods():
+    """Test that read-only methods and comparisons stay dict's C methods."""
+    from context.BaseObject import TrackedDict
+
+    for name in (
+        "__getitem__",
+        "get",
+        "keys",
+        "values",
+        "items",
+        "__iter__",
+        "__len__",
+        "__contains__",
+        "copy",
+        "__eq__",
+        "__ne__",
+    ):
+        assert getattr(TrackedDict, name) is getattr(dict, name), name
+
+
+def test_tracked_dict_copy_and_pickle(count_notifications):
+    """Test that copies and pickles are built in bulk, without notifying."""
+    import copy
+    import pickle
+
+    from context.BaseObject import TrackedDict
+
+    font = Font(_={"com.test": "value", "com.nested": {"a": 1}})
+    font.initialize_dirty_tracking()
+    user_data = font.user_data
+    calls = count_notifications(font)
+
+    for duplicate in (
+        copy.copy(user_data),
+        copy.deepcopy(user_data),
+        pickle.loads(pickle.dumps(user_data)),
+    ):
+        assert type(duplicate) is TrackedDict
+        assert duplicate == {"com.test": "value", "com.nested": {"a": 1}}
+        duplicate["com.test"] = "changed"
+    assert calls == []
+    assert user_data["com.test"] == "value"
+
+
 def test_tracked_dict_multiple_contexts():
     """Test that TrackedDict marks dirty for all relevant contexts."""
     font = Font()
@@ -337,6 +523,58 @@ def test_tracked_dict_add_nested_dict():
     assert font.is_dirty(DIRTY_FILE_SAVING)
 
 
+def test_tracked_dict_nested_references_stay_attached():
+    """Test that nested dicts reached through views write through to the owner."""
+    from context.BaseObject import TrackedDict
+
+    font = Font(_={"deep": {"a": 1}, "items": [{"id": 1}]})
+    font.initialize_dirty_tracking()
+    user_data = font.user_data
+    font.user_data["new"] = {"b": 2}
+    font.user_data.update(other={"c": 3})
+
+    # References taken before any item read are the stored objects
+    nested = dict(user_data.items())
+    for key in ("deep", "new", "other"):
+        assert isinstance(nested[key], TrackedDict)
+        assert nested[key] is user_data[key]
+    assert list(user_data.values())[0] is user_data["deep"]
+    assert user_data["items"][0] is nested["items"][0]
+
+    font.mark_clean(DIRTY_FILE_SAVING)
+    nested["deep"]["a"] = 2
+    assert user_data["deep"]["a"] == 2
+    assert font.is_dirty(DIRTY_FILE_SAVING)
+
+    font.mark_clean(DIRTY_FILE_SAVING)
+    nested["items"][0]["id"] = 2
+    assert font._data["_"]["items"][0]["id"] == 2
+    assert font.is_dirty(DIRTY_FILE_SAVING)
+
+
+def test_first_user_data_read_keeps_object_clean():
+    """Test that converting user_data to a TrackedDict on read isn't a change."""
+    from context.BaseObject import TrackedDict
+
+    font = Font(_={"com.test": {"nested": 1}})
+    font.initialize_dirty_tracking()
+
+    assert isinstance(font.user_data, TrackedDict)
+    assert font.user_data == {"com.test": {"nested": 1}}
+    assert not font.is_dirty(DIRTY_FILE_SAVING)
+
+
+def test_write_keeps_user_data_unwrapped():
+    """Test that serializing doesn't convert stored user_data."""
+    font = Font()
+    font.initialize_dirty_tracking()
+    glyph = Glyph(name="a", _={"com.test": {"nested": 1}})
+    font.glyphs.append(glyph)
+
+    assert b'"com.test"' in glyph.write_bytes()
+    assert type(glyph._data["_"]) is dict
+
+
 def test_tracked_dict_popitem():
     """Test that popitem() marks object dirty."""
     font = Font(_={"key1": "value1", "key2": "value2"})